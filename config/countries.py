@@ -2,6 +2,8 @@
 Country configurations for Wilo website
 """
 
+from functools import lru_cache
+
 COUNTRIES = {
     'germany': {
         'name': 'Deutschland',
@@ -61,17 +63,21 @@ COUNTRIES = {
     }
 }
 
+# Reverse index by display name, built once so lookups are a single dict hit
+COUNTRIES_BY_NAME = {data['name']: (key, data) for key, data in COUNTRIES.items()}
+
+# Supported country keys in display order; a tuple, so it can be handed out without copying
+COUNTRY_KEYS = tuple(COUNTRIES)
+
+@lru_cache(maxsize=32)
 def get_country_config(country_key):
-    """Get configuration for specific country"""
+    """Get configuration for specific country (the shared COUNTRIES entry, not a copy)"""
     return COUNTRIES.get(country_key.lower())
 
 def get_all_countries():
-    """Get list of all supported countries"""
-    return list(COUNTRIES.keys())
+    """Get all supported country keys (a shared tuple)"""
+    return COUNTRY_KEYS
 
 def get_country_by_name(country_name):
     """Get country data by display name"""
-    for key, data in COUNTRIES.items():
-        if data['name'] == country_name:
-            return key, data
-    return None, None
+    return COUNTRIES_BY_NAME.get(country_name, (None, None))
@@ -6,9 +6,18 @@ import os
 import json
 from pathlib import Path
 from typing import Dict, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed config files by path, as (mtime_ns, data); load() only re-parses a file that changed.
+# The cached data is shared between instances and must not be modified.
+CONFIG_CACHE = {}
+
 @dataclass
 class ShopifyConfig:
     shop_url: str = ""
@@ -25,6 +34,10 @@ class ScrapingConfig:
     download_images: bool = True
     concurrent_requests: int = 3
     timeout: int = 30
+    debug_screenshots: bool = False
+    browser_workers: int = 3
+    browser_tabs: int = 4
+    browser_profile_dir: str = "~/.wilo_cache/chrome_profile"
 
 @dataclass
 class DatabaseConfig:
@@ -40,9 +53,39 @@ class LogConfig:
     max_file_size: str = "10MB"
     backup_count: int = 5
 
+# Keys each config.json section may set, taken from the dataclass fields so a new setting needs no extra list
+SHOPIFY_KEYS = frozenset(field.name for field in fields(ShopifyConfig))
+SCRAPING_KEYS = frozenset(field.name for field in fields(ScrapingConfig))
+DATABASE_KEYS = frozenset(field.name for field in fields(DatabaseConfig))
+LOG_CONFIG_KEYS = frozenset(field.name for field in fields(LogConfig))
+
+def legacy_alias(section: str, field_name: str) -> property:
+    """Flat legacy attribute that reads and writes a field of a config section"""
+    return property(
+        lambda self: getattr(getattr(self, section), field_name),
+        lambda self, value: setattr(getattr(self, section), field_name, value),
+    )
+
 class AppSettings:
     """Main application settings manager"""
     
+    # Legacy compatibility properties; they forward to the config sections, so there is no copy to keep in sync
+    shopify_shop_url = legacy_alias('shopify', 'shop_url')
+    shopify_access_token = legacy_alias('shopify', 'access_token')
+    headless_mode = legacy_alias('scraping', 'headless_mode')
+    browser_timeout = legacy_alias('scraping', 'timeout')
+    page_load_delay = legacy_alias('scraping', 'delay_between_actions')
+    max_products_per_category = legacy_alias('scraping', 'max_products_per_category')
+    download_images = legacy_alias('scraping', 'download_images')
+    max_concurrent_downloads = legacy_alias('scraping', 'concurrent_requests')
+    debug_screenshots = legacy_alias('scraping', 'debug_screenshots')
+    browser_workers = legacy_alias('scraping', 'browser_workers')
+    browser_tabs = legacy_alias('scraping', 'browser_tabs')
+    browser_profile_dir = legacy_alias('scraping', 'browser_profile_dir')
+    
+    # Directories already created by this process, so later instances skip the mkdir calls
+    _created_dirs = set()
+    
     def __init__(self, config_path: str = None):
         self.config_path = config_path or self._get_default_config_path()
         self.shopify = ShopifyConfig()
@@ -50,29 +93,6 @@ class AppSettings:
         self.database = DatabaseConfig()
         self.log_config = LogConfig()
         
-        # Legacy compatibility properties
-        self._setup_legacy_properties()
-        
-        # Load from file if exists
-        self.load()
-        
-        # Load from environment variables
-        self._load_from_env()
-    
-    def _setup_legacy_properties(self):
-        """Setup legacy properties for backward compatibility"""
-        # Shopify legacy properties
-        self.shopify_shop_url = self.shopify.shop_url
-        self.shopify_access_token = self.shopify.access_token
-        
-        # Browser/Scraping legacy properties
-        self.headless_mode = self.scraping.headless_mode
-        self.browser_timeout = self.scraping.timeout
-        self.page_load_delay = self.scraping.delay_between_actions
-        self.max_products_per_category = self.scraping.max_products_per_category
-        self.download_images = self.scraping.download_images
-        self.max_concurrent_downloads = self.scraping.concurrent_requests
-        
         # Directory paths
         self.project_root = Path(__file__).parent.parent
         self.data_dir = self.project_root / 'data'
@@ -82,7 +102,15 @@ class AppSettings:
         
         # Ensure directories exist
         for directory in [self.data_dir, self.logs_dir, self.images_dir, self.exports_dir]:
-            directory.mkdir(exist_ok=True)
+            if directory not in AppSettings._created_dirs:
+                directory.mkdir(exist_ok=True)
+                AppSettings._created_dirs.add(directory)
+        
+        # Load from file if exists
+        self.load()
+        
+        # Load from environment variables
+        self._load_from_env()
     
     def _get_default_config_path(self) -> str:
         """Get default config file path"""
@@ -93,96 +121,111 @@ class AppSettings:
     def load(self):
         """Load configuration from file"""
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    data = json.load(f)
-                
-                # Load each section
-                if 'shopify' in data:
-                    shopify_data = data['shopify']
-                    # Filter out invalid keys for dataclass
-                    valid_keys = {k: v for k, v in shopify_data.items() 
-                                if k in ['shop_url', 'access_token', 'api_version', 'webhook_url', 'rate_limit_strategy']}
-                    self.shopify = ShopifyConfig(**valid_keys)
-                
-                if 'scraping' in data:
-                    scraping_data = data['scraping']
-                    valid_keys = {k: v for k, v in scraping_data.items() 
-                                if k in ['max_products_per_category', 'delay_between_actions', 'headless_mode', 
-                                       'download_images', 'concurrent_requests', 'timeout']}
-                    self.scraping = ScrapingConfig(**valid_keys)
-                
-                if 'database' in data:
-                    db_data = data['database']
-                    valid_keys = {k: v for k, v in db_data.items() 
-                                if k in ['type', 'url', 'pool_size', 'max_overflow']}
-                    self.database = DatabaseConfig(**valid_keys)
-                
-                if 'log_config' in data:
-                    log_data = data['log_config']
-                    valid_keys = {k: v for k, v in log_data.items() 
-                                if k in ['level', 'file', 'max_file_size', 'backup_count']}
-                    self.log_config = LogConfig(**valid_keys)
-                
-                # Update legacy properties
-                self._setup_legacy_properties()
-                
+            # A missing file just means defaults
+            config_file = Path(self.config_path)
+            try:
+                mtime = config_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                return
+            
+            cached = CONFIG_CACHE.get(self.config_path)
+            if cached and cached[0] == mtime:
+                data = cached[1]
+            else:
+                raw = config_file.read_bytes()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                CONFIG_CACHE[self.config_path] = (mtime, data)
+            
+            # Load each section
+            if 'shopify' in data:
+                shopify_data = data['shopify']
+                # Filter out invalid keys for dataclass
+                valid_keys = {k: v for k, v in shopify_data.items() if k in SHOPIFY_KEYS}
+                self.shopify = ShopifyConfig(**valid_keys)
+            
+            if 'scraping' in data:
+                scraping_data = data['scraping']
+                valid_keys = {k: v for k, v in scraping_data.items() if k in SCRAPING_KEYS}
+                self.scraping = ScrapingConfig(**valid_keys)
+            
+            if 'database' in data:
+                db_data = data['database']
+                valid_keys = {k: v for k, v in db_data.items() if k in DATABASE_KEYS}
+                self.database = DatabaseConfig(**valid_keys)
+            
+            if 'log_config' in data:
+                log_data = data['log_config']
+                valid_keys = {k: v for k, v in log_data.items() if k in LOG_CONFIG_KEYS}
+                self.log_config = LogConfig(**valid_keys)
+            
         except Exception as e:
             logging.warning(f"Failed to load config from {self.config_path}: {e}")
     
     def save(self):
         """Save configuration to file"""
         try:
-            data = {
-                'shopify': asdict(self.shopify),
-                'scraping': asdict(self.scraping),
-                'database': asdict(self.database),
-                'log_config': asdict(self.log_config)
-            }
+            # Encoded straight to UTF-8 bytes, by orjson when it is installed
+            data = self.get_all_settings()
+            if orjson:
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                content = json.dumps(data, indent=2).encode('utf-8')
             
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Leave the file untouched when nothing changed
+            try:
+                if Path(self.config_path).read_bytes() == content:
+                    logging.debug(f"Config unchanged, not rewriting {self.config_path}")
+                    return
+            except FileNotFoundError:
+                pass
+            
+            # Write to a sibling temp file and swap it in, so a crash never leaves a truncated config
+            config_file = Path(self.config_path)
+            config_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = config_file.with_name(config_file.name + '.tmp')
+            tmp_file.write_bytes(content)
+            os.replace(tmp_file, config_file)
                 
         except Exception as e:
             logging.error(f"Failed to save config: {e}")
     
     def _load_from_env(self):
         """Load settings from environment variables"""
+        # Each variable is read once; unset or empty values leave the setting alone
         # Shopify settings
-        if os.getenv('SHOPIFY_SHOP_URL'):
-            self.shopify.shop_url = os.getenv('SHOPIFY_SHOP_URL')
-            self.shopify_shop_url = self.shopify.shop_url
-            
-        if os.getenv('SHOPIFY_ACCESS_TOKEN'):
-            self.shopify.access_token = os.getenv('SHOPIFY_ACCESS_TOKEN')
-            self.shopify_access_token = self.shopify.access_token
+        value = os.getenv('SHOPIFY_SHOP_URL')
+        if value:
+            self.shopify.shop_url = value
+        
+        value = os.getenv('SHOPIFY_ACCESS_TOKEN')
+        if value:
+            self.shopify.access_token = value
         
         # Browser settings
-        if os.getenv('HEADLESS_MODE'):
-            self.scraping.headless_mode = os.getenv('HEADLESS_MODE', 'false').lower() == 'true'
-            self.headless_mode = self.scraping.headless_mode
-            
-        if os.getenv('BROWSER_TIMEOUT'):
-            self.scraping.timeout = int(os.getenv('BROWSER_TIMEOUT', '30'))
-            self.browser_timeout = self.scraping.timeout
-            
-        if os.getenv('PAGE_LOAD_DELAY'):
-            self.scraping.delay_between_actions = int(os.getenv('PAGE_LOAD_DELAY', '3'))
-            self.page_load_delay = self.scraping.delay_between_actions
+        value = os.getenv('HEADLESS_MODE')
+        if value:
+            self.scraping.headless_mode = value.lower() == 'true'
+        
+        value = os.getenv('BROWSER_TIMEOUT')
+        if value:
+            self.scraping.timeout = int(value)
+        
+        value = os.getenv('PAGE_LOAD_DELAY')
+        if value:
+            self.scraping.delay_between_actions = int(value)
         
         # Scraping settings
-        if os.getenv('MAX_PRODUCTS_PER_CATEGORY'):
-            self.scraping.max_products_per_category = int(os.getenv('MAX_PRODUCTS_PER_CATEGORY', '100'))
-            self.max_products_per_category = self.scraping.max_products_per_category
-            
-        if os.getenv('DOWNLOAD_IMAGES'):
-            self.scraping.download_images = os.getenv('DOWNLOAD_IMAGES', 'true').lower() == 'true'
-            self.download_images = self.scraping.download_images
-            
-        if os.getenv('MAX_CONCURRENT_DOWNLOADS'):
-            self.scraping.concurrent_requests = int(os.getenv('MAX_CONCURRENT_DOWNLOADS', '5'))
-            self.max_concurrent_downloads = self.scraping.concurrent_requests
+        value = os.getenv('MAX_PRODUCTS_PER_CATEGORY')
+        if value:
+            self.scraping.max_products_per_category = int(value)
+        
+        value = os.getenv('DOWNLOAD_IMAGES')
+        if value:
+            self.scraping.download_images = value.lower() == 'true'
+        
+        value = os.getenv('MAX_CONCURRENT_DOWNLOADS')
+        if value:
+            self.scraping.concurrent_requests = int(value)
     
     def get_shopify_headers(self):
         """Get Shopify API headers"""
@@ -195,8 +238,6 @@ class AppSettings:
         """Update Shopify settings"""
         self.shopify.shop_url = shop_url
         self.shopify.access_token = access_token
-        self.shopify_shop_url = shop_url
-        self.shopify_access_token = access_token
         self.save()
     
     def update_scraping_settings(self, **kwargs):
@@ -204,9 +245,6 @@ class AppSettings:
         for key, value in kwargs.items():
             if hasattr(self.scraping, key):
                 setattr(self.scraping, key, value)
-                # Also update legacy property if it exists
-                if hasattr(self, key):
-                    setattr(self, key, value)
         self.save()
     
     def get_browser_settings(self):
@@ -219,9 +257,10 @@ class AppSettings:
     
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all settings as dictionary"""
+        # The sections hold only flat scalar fields, so a shallow copy is all asdict's deep walk would produce
         return {
-            'shopify': asdict(self.shopify),
-            'scraping': asdict(self.scraping),
-            'database': asdict(self.database),
-            'log_config': asdict(self.log_config)
+            'shopify': dict(vars(self.shopify)),
+            'scraping': dict(vars(self.scraping)),
+            'database': dict(vars(self.database)),
+            'log_config': dict(vars(self.log_config))
         }
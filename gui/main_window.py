@@ -3,16 +3,45 @@ Enhanced Main Window with dual scraper support
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import os
 import threading
+import io
+import csv
+import json
+from datetime import datetime
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from gui.widgets.progress_tracker import ProgressTracker
 from gui.widgets.results_table import ResultsTable
 from gui.widgets.shopify_config import ShopifyConfig
 from gui.widgets.enhanced_scraper_controller import EnhancedScraperController
 from utils.logger import get_logger, LogCapture, GUILogHandler
 
+# Larger exports are streamed as JSON Lines instead of one indented document
+JSONL_EXPORT_THRESHOLD = 10000
+
+# Large write buffer so exports hit the disk in few syscalls
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Columns written by the CSV export
+EXPORT_FIELDS = ('name', 'source', 'category', 'subcategory', 'short_description', 'price', 'country', 'status')
+
+# Rows handed to csv.writer.writerows per batch, bounding the in-memory row list
+CSV_BATCH_SIZE = 10000
+
+# Exports below this size are rendered in memory and written with a single call
+CSV_IN_MEMORY_LIMIT = 50000
+
+def _timestamp():
+    """Timestamp used in default export filenames"""
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
 class MainWindow:
     """Enhanced main application window with dual scraper support"""
     
@@ -24,6 +53,19 @@ class MainWindow:
         # Initialize variables
         self.scraped_products = []
         
+        # Running statistics, updated as products are added
+        self._total = 0
+        self._catalog_count = 0
+        self._categories = set()
+        self._last_name_display = ''
+        
+        # Redraw statistics only every N inserts (and when scraping stops)
+        self._update_interval = 25
+        self._since_last_update = 0
+        
+        # Set when statistics changed while their tab was hidden
+        self._stats_dirty = False
+        
         # Setup logging for GUI
         self.log_capture = LogCapture()
         self.gui_log_handler = GUILogHandler(self.log_capture)
@@ -63,6 +105,7 @@ class MainWindow:
         self.notebook.add(self.main_frame, text="🚀 Enhanced Scraper")
         self.notebook.add(self.shopify_frame, text="🛒 Shopify Integration")
         self.notebook.add(self.results_frame, text="📊 Results & Export")
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Create main tab content
         self._create_main_tab()
@@ -128,8 +171,8 @@ class MainWindow:
         stats_frame = ttk.LabelFrame(left_panel, text="Statistics", padding=10)
         stats_frame.pack(fill=tk.X, pady=5)
         
-        self.stats_text = tk.Text(stats_frame, height=6, state='disabled')
-        self.stats_text.pack(fill=tk.X)
+        self.stats_var = tk.StringVar()
+        ttk.Label(stats_frame, textvariable=self.stats_var, justify=tk.LEFT).pack(fill=tk.X)
         
         # Right panel for progress and logs
         right_panel = ttk.Frame(self.main_frame)
@@ -172,6 +215,12 @@ class MainWindow:
             command=self.export_json
         ).pack(side=tk.LEFT, padx=5)
         
+        ttk.Button(
+            export_frame,
+            text="📜 Export to JSONL",
+            command=self.export_jsonl
+        ).pack(side=tk.LEFT, padx=5)
+        
         ttk.Button(
             export_frame,
             text="🗑️ Clear Results",
@@ -182,56 +231,82 @@ class MainWindow:
         summary_frame = ttk.LabelFrame(self.results_frame, text="Summary", padding=10)
         summary_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.summary_text = tk.Text(summary_frame, height=8, state='disabled')
-        self.summary_text.pack(fill=tk.X)
+        self.summary_var = tk.StringVar()
+        ttk.Label(summary_frame, textvariable=self.summary_var, justify=tk.LEFT).pack(fill=tk.X)
     
     def update_progress(self, message, start_progress=False, stop_progress=False):
         """Update progress display"""
         self.status_var.set(message)
         self.progress_tracker.update_progress(message, start_progress, stop_progress)
+        
+        # Flush throttled statistics once the scrape has finished
+        if stop_progress and self._since_last_update:
+            self._update_statistics()
+            self._since_last_update = 0
     
     def add_product(self, product_data):
         """Add product to results"""
         self.scraped_products.append(product_data)
         self.results_table.add_product(product_data)
-        self._update_statistics()
         
-        # Enable upload button if we have products
-        if len(self.scraped_products) > 0:
+        self._total = len(self.scraped_products)
+        if product_data.get('source') == 'catalog':
+            self._catalog_count += 1
+        self._categories.add(product_data.get('category', 'Unknown'))
+        name = product_data.get('name', 'Unknown')
+        self._last_name_display = f"{name[:30]}..." if len(name) > 30 else name
+        
+        self._since_last_update += 1
+        if self._since_last_update >= self._update_interval:
+            self._update_statistics()
+            self._since_last_update = 0
+        
+        # Enable upload button once we have products
+        if len(self.scraped_products) == 1:
             self.upload_button.config(state=tk.NORMAL)
     
+    def _on_tab_changed(self, event=None):
+        """Render statistics that changed while their tab was hidden"""
+        if self._stats_dirty:
+            self._update_statistics()
+    
     def _update_statistics(self):
         """Update statistics display"""
         try:
-            if not self.scraped_products:
+            # The statistics live on the main tab; don't redraw them while it is hidden
+            if self.notebook.select() != str(self.main_frame):
+                self._stats_dirty = True
                 return
+            self._stats_dirty = False
             
-            # Calculate statistics
-            total_products = len(self.scraped_products)
-            catalog_products = sum(1 for p in self.scraped_products if p.get('source') == 'catalog')
-            original_products = total_products - catalog_products
-            
-            categories = set(p.get('category', 'Unknown') for p in self.scraped_products)
-            
-            # Update stats text - FIXED F-STRING
-            self.stats_text.config(state='normal')
-            self.stats_text.delete(1.0, tk.END)
+            if not self._total:
+                self.stats_var.set("")
+                return
             
-            stats = f"Total Products: {total_products}\n"
-            stats += f"Catalog Products: {catalog_products}\n" 
-            stats += f"Original Products: {original_products}\n"
-            stats += f"Unique Categories: {len(categories)}\n"
+            original_products = self._total - self._catalog_count
             
-            if self.scraped_products:
-                last_product = self.scraped_products[-1]
-                stats += f"Last Added: {last_product.get('name', 'Unknown')[:30]}..."
+            stats = (
+                f"Total Products: {self._total}\n"
+                f"Catalog Products: {self._catalog_count}\n"
+                f"Original Products: {original_products}\n"
+                f"Unique Categories: {len(self._categories)}\n"
+                f"Last Added: {self._last_name_display}"
+            )
             
-            self.stats_text.insert(1.0, stats)
-            self.stats_text.config(state='disabled')
+            self.stats_var.set(stats)
             
         except Exception as e:
             self.logger.error(f"Error updating statistics: {e}")
     
+    def _reset_statistics(self):
+        """Reset the running statistics after all products are cleared"""
+        self._total = 0
+        self._catalog_count = 0
+        self._categories.clear()
+        self._last_name_display = ''
+        self._since_last_update = 0
+        self._update_statistics()
+    
     def quick_shopify_upload(self):
         """Quick Shopify upload"""
         try:
@@ -242,13 +317,15 @@ class MainWindow:
             # Switch to Shopify tab
             self.notebook.select(1)
             
-            # Show upload confirmation - FIXED F-STRING
-            catalog_count = sum(1 for p in self.scraped_products if p.get('source') == 'catalog')
-            original_count = sum(1 for p in self.scraped_products if p.get('source') != 'catalog')
+            # Show upload confirmation from the running counters
+            catalog_count = self._catalog_count
+            original_count = self._total - catalog_count
             
-            message = f"Upload {len(self.scraped_products)} products to Shopify?\n\n"
-            message += f"Catalog products: {catalog_count}\n"
-            message += f"Original products: {original_count}"
+            message = (
+                f"Upload {self._total} products to Shopify?\n\n"
+                f"Catalog products: {catalog_count}\n"
+                f"Original products: {original_count}"
+            )
             
             result = messagebox.askyesno("Quick Upload", message)
             
@@ -274,9 +351,9 @@ class MainWindow:
             
             if result:
                 self.scraped_products.clear()
+                self._reset_statistics()
                 self.scraper_controller.clear_results()
                 self.results_table.clear()
-                self._update_statistics()
                 self.upload_button.config(state=tk.DISABLED)
                 self.status_var.set("All results cleared")
             
@@ -290,35 +367,19 @@ class MainWindow:
                 messagebox.showwarning("No Data", "No products to export")
                 return
             
-            from tkinter import filedialog
-            import csv
-            from datetime import datetime
-            
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_filename = f"wilo_products_{timestamp}.csv"
+            default_filename = f"wilo_products_{_timestamp()}.csv"
             
             file_path = filedialog.asksaveasfilename(
                 title="Export to CSV",
                 defaultextension=".csv",
-                initialvalue=default_filename,
+                initialfile=default_filename,
                 filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
             )
             
             if not file_path:
                 return
             
-            # Export to CSV
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = ['name', 'source', 'category', 'subcategory', 'short_description', 'price', 'country', 'status']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for product in self.scraped_products:
-                    row = {field: product.get(field, '') for field in fieldnames}
-                    writer.writerow(row)
-            
-            messagebox.showinfo("Export Complete", f"✅ Exported {len(self.scraped_products)} products to CSV!")
+            self._start_export(self._write_csv, file_path, "CSV")
             
         except Exception as e:
             messagebox.showerror("Error", f"❌ CSV export failed: {e}")
@@ -330,33 +391,137 @@ class MainWindow:
                 messagebox.showwarning("No Data", "No products to export")
                 return
             
-            from tkinter import filedialog
-            import json
-            from datetime import datetime
+            if len(self.scraped_products) > JSONL_EXPORT_THRESHOLD:
+                self.export_jsonl()
+                return
             
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_filename = f"wilo_products_{timestamp}.json"
+            default_filename = f"wilo_products_{_timestamp()}.json"
             
             file_path = filedialog.asksaveasfilename(
                 title="Export to JSON",
                 defaultextension=".json",
-                initialvalue=default_filename,
+                initialfile=default_filename,
                 filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
             )
             
             if not file_path:
                 return
             
-            # Export to JSON
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.scraped_products, f, indent=2, ensure_ascii=False)
-            
-            messagebox.showinfo("Export Complete", f"✅ Exported {len(self.scraped_products)} products to JSON!")
+            self._start_export(self._write_json, file_path, "JSON")
             
         except Exception as e:
             messagebox.showerror("Error", f"❌ JSON export failed: {e}")
     
+    def export_jsonl(self):
+        """Export results to JSON Lines (one product per line)"""
+        try:
+            if not self.scraped_products:
+                messagebox.showwarning("No Data", "No products to export")
+                return
+            
+            default_filename = f"wilo_products_{_timestamp()}.jsonl"
+            
+            file_path = filedialog.asksaveasfilename(
+                title="Export to JSONL",
+                defaultextension=".jsonl",
+                initialfile=default_filename,
+                filetypes=[("JSON Lines files", "*.jsonl"), ("All files", "*.*")]
+            )
+            
+            if not file_path:
+                return
+            
+            self._start_export(self._write_jsonl, file_path, "JSONL")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"❌ JSONL export failed: {e}")
+    
+    def _start_export(self, write_func, file_path, format_name):
+        """Write an export on a background thread so the GUI stays responsive"""
+        # Snapshot the list so the scraper thread can keep appending meanwhile
+        products = list(self.scraped_products)
+        self.status_var.set(f"Exporting {len(products)} products to {format_name}...")
+        
+        thread = threading.Thread(target=self._export_worker, args=(write_func, file_path, products, format_name))
+        thread.daemon = True
+        thread.start()
+    
+    def _export_worker(self, write_func, file_path, products, format_name):
+        """Worker thread for exports"""
+        # Written to a sibling temp file and swapped in at the end, so closing the window mid-export
+        # (the thread is a daemon) never leaves a truncated file under the chosen name
+        tmp_path = file_path + '.tmp'
+        try:
+            write_func(tmp_path, products)
+            os.replace(tmp_path, file_path)
+            self.root.after(0, self._on_export_completed, len(products), format_name)
+        except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            self.root.after(0, self._on_export_failed, str(e), format_name)
+    
+    def _on_export_completed(self, product_count, format_name):
+        """Handle export completion"""
+        self.status_var.set(f"Exported {product_count} products to {format_name}")
+        messagebox.showinfo("Export Complete", f"✅ Exported {product_count} products to {format_name}!")
+    
+    def _on_export_failed(self, error_message, format_name):
+        """Handle export failure"""
+        self.status_var.set(f"{format_name} export failed")
+        messagebox.showerror("Error", f"❌ {format_name} export failed: {error_message}")
+    
+    def _write_csv(self, file_path, products):
+        """Write products to CSV, in memory for mid-size exports and in batches otherwise"""
+        if len(products) < CSV_IN_MEMORY_LIMIT:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_FIELDS)
+            writer.writerows([product.get(field, '') for field in EXPORT_FIELDS] for product in products)
+            
+            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                f.write(buffer.getvalue())
+            return
+        
+        with open(file_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_FIELDS)
+            
+            batch = []
+            for product in products:
+                batch.append([product.get(field, '') for field in EXPORT_FIELDS])
+                if len(batch) >= CSV_BATCH_SIZE:
+                    writer.writerows(batch)
+                    batch.clear()
+                    f.flush()
+            
+            if batch:
+                writer.writerows(batch)
+    
+    def _write_json(self, file_path, products):
+        """Write products as one indented JSON document"""
+        # orjson encodes the whole document in one native call
+        if orjson:
+            with open(file_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(products, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                json.dump(products, f, indent=2, ensure_ascii=False)
+    
+    def _write_jsonl(self, file_path, products):
+        """Stream products to disk one object at a time without building the whole document"""
+        with open(file_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            write = f.write
+            if orjson:
+                for product in products:
+                    write(orjson.dumps(product, option=orjson.OPT_NON_STR_KEYS))
+                    write(b'\n')
+            else:
+                for product in products:
+                    write(json.dumps(product, ensure_ascii=False).encode('utf-8'))
+                    write(b'\n')
+    
     def clear_results(self):
         """Clear results table"""
         try:
@@ -4,7 +4,7 @@ Country selection widget
 
 import tkinter as tk
 from tkinter import ttk
-from config.countries import COUNTRIES, get_all_countries
+from config.countries import COUNTRIES, get_all_countries, get_country_by_name
 
 class CountrySelector(ttk.LabelFrame):
     """Widget for selecting target country"""
@@ -43,28 +43,19 @@ class CountrySelector(ttk.LabelFrame):
         """Handle country selection change"""
         try:
             country_name = self.selected_country.get()
-            # Find country data
-            country_data = None
-            for key, data in COUNTRIES.items():
-                if data['name'] == country_name:
-                    country_data = data
-                    break
+            _, country_data = get_country_by_name(country_name)
             
             if country_data:
                 info = f"Language: {country_data['language']}\n"
                 info += f"Pump Selection Text: {country_data['hydraulic_pump_text']}"
                 
                 self.info_text.config(state='normal')
-                self.info_text.delete(1.0, tk.END)
-                self.info_text.insert(1.0, info)
+                self.info_text.replace(1.0, tk.END, info)
                 self.info_text.config(state='disabled')
         except Exception:
             pass
     
     def get_selected_country_key(self):
         """Get the key for selected country"""
-        country_name = self.selected_country.get()
-        for key, data in COUNTRIES.items():
-            if data['name'] == country_name:
-                return key
-        return 'germany'  # Default
+        key, _ = get_country_by_name(self.selected_country.get())
+        return key or 'germany'  # Default
@@ -179,8 +179,8 @@ class EnhancedScraperController(ttk.LabelFrame):
         try:
             # FIXED: Pass the correct max_products value
             self.logger.info(f"Worker thread starting with max_products = {max_products}")
+            # Products already reached scraped_products one by one through _add_product
             products = self.catalog_scraper.start_scraping(max_products)
-            self.scraped_products.extend(products)
             
             # Update UI on main thread
             self.after(0, self._on_scraping_completed, len(products), "catalog")
@@ -209,9 +209,11 @@ class EnhancedScraperController(ttk.LabelFrame):
         
         self.status_var.set(f"Catalog scraping completed! Found {product_count} products")
         
-        message = f"✅ Catalog scraping completed!\n\n"
-        message += f"Found {product_count} new products\n"
-        message += f"Total products: {len(self.scraped_products)}"
+        message = (
+            f"✅ Catalog scraping completed!\n\n"
+            f"Found {product_count} new products\n"
+            f"Total products: {len(self.scraped_products)}"
+        )
         
         messagebox.showinfo("Scraping Complete", message)
     
@@ -296,24 +298,24 @@ class EnhancedScraperController(ttk.LabelFrame):
         results_text.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
         
-        # Display results
-        header = f"=== CATALOG SCRAPING RESULTS ({len(self.scraped_products)} products) ===\n\n"
-        results_text.insert('1.0', header)
+        # Display results (built as one string so the Text widget is filled with a single insert)
+        parts = [f"=== CATALOG SCRAPING RESULTS ({len(self.scraped_products)} products) ===\n\n"]
         
         for i, product in enumerate(self.scraped_products, 1):
-            results_text.insert('end', f"{i}. {product.get('name', 'Unknown')}\n")
-            results_text.insert('end', f"   Source: {product.get('source', 'catalog')}\n")
-            results_text.insert('end', f"   Category: {product.get('category', 'Unknown')}\n")
-            results_text.insert('end', f"   Images: {len(product.get('product_images', []))} product + {1 if product.get('card_image_url') else 0} card\n")
+            parts.append(f"{i}. {product.get('name', 'Unknown')}\n")
+            parts.append(f"   Source: {product.get('source', 'catalog')}\n")
+            parts.append(f"   Category: {product.get('category', 'Unknown')}\n")
+            parts.append(f"   Images: {len(product.get('product_images', []))} product + {1 if product.get('card_image_url') else 0} card\n")
             if product.get('short_description'):
                 desc = product['short_description'][:100] + "..." if len(product['short_description']) > 100 else product['short_description']
-                results_text.insert('end', f"   Description: {desc}\n")
+                parts.append(f"   Description: {desc}\n")
             if product.get('advantages'):
-                results_text.insert('end', f"   Advantages: {len(product['advantages'])} items\n")
+                parts.append(f"   Advantages: {len(product['advantages'])} items\n")
             if product.get('technical_specifications'):
-                results_text.insert('end', f"   Technical Tables: {len(product['technical_specifications'])} tables\n")
-            results_text.insert('end', "\n")
+                parts.append(f"   Technical Tables: {len(product['technical_specifications'])} tables\n")
+            parts.append("\n")
         
+        results_text.insert('1.0', ''.join(parts))
         results_text.config(state='disabled')
     
     def get_scraped_products(self):
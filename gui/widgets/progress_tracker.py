@@ -53,15 +53,14 @@ class ProgressTracker(ttk.LabelFrame):
         try:
             logs = self.log_capture.get_recent(100)
             
-            self.log_text.config(state='normal')
-            self.log_text.delete(1.0, tk.END)
+            formatted = "".join(
+                f"[{log_entry['timestamp'].strftime('%H:%M:%S')}] [{log_entry['level']}] {log_entry['message']}\n"
+                for log_entry in logs
+            )
             
-            for log_entry in logs:
-                timestamp = log_entry['timestamp'].strftime("%H:%M:%S")
-                level = log_entry['level']
-                message = log_entry['message']
-                formatted = f"[{timestamp}] [{level}] {message}\n"
-                self.log_text.insert(tk.END, formatted)
+            # One replace call instead of a delete plus one insert per line
+            self.log_text.config(state='normal')
+            self.log_text.replace(1.0, tk.END, formatted)
             
             self.log_text.see(tk.END)
             self.log_text.config(state='disabled')
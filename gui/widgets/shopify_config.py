@@ -8,7 +8,28 @@ import threading
 import json
 import requests
 import time
+import io
+from html import escape
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+# Image URLs checked at the same time per product; kept low so wilo.com is not hammered
+IMAGE_CHECK_WORKERS = 5
+
+# Fixed description sections, joined once instead of on every upload
+DEFAULT_FEATURES_HTML = (
+    "<h3>Key Features</h3>\n"
+    "<ul>\n"
+    "<li>High-quality German engineering</li>\n"
+    "<li>Energy-efficient operation</li>\n"
+    "<li>Reliable performance for industrial applications</li>\n"
+    "</ul>\n"
+)
+ABOUT_WILO_HTML = (
+    "<h3>About Wilo</h3>\n"
+    "<p>Wilo is a leading manufacturer of pumps and pump systems for heating, cooling, air conditioning, water supply and wastewater treatment.</p>"
+)
 
 class ShopifyClient:
     def __init__(self, shop_url, access_token):
@@ -23,6 +44,12 @@ class ShopifyClient:
             'X-Shopify-Access-Token': access_token,
             'Content-Type': 'application/json'
         }
+        
+        # Keep-alive connections shared by the image checks and the product POSTs
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=IMAGE_CHECK_WORKERS * 2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def _validate_image_url(self, url):
         """Simple image URL validation"""
@@ -35,15 +62,58 @@ class ShopifyClient:
             valid_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp')
             if any(ext in url.lower() for ext in valid_extensions) or 'wilo.com' in url.lower():
                 try:
-                    response = requests.head(url, timeout=5, allow_redirects=True)
+                    response = self.session.head(url, timeout=5, allow_redirects=True)
                     if response.status_code == 200:
                         return url
-                except:
+                except requests.RequestException:
                     pass
             return None
-        except:
+        except Exception:
             return None
     
+    def _build_description(self, name, short_description, advantages, category, subcategory, table_data):
+        """Build the product's HTML body; scraped text is escaped before it becomes HTML"""
+        buffer = io.StringIO()
+        name = escape(name, quote=False)
+        buffer.write(f"<h1>{name}</h1>\n")
+        
+        if short_description and len(short_description.strip()) > 20:
+            buffer.write(f"<p>{escape(short_description, quote=False)}</p>\n")
+            print("ADDED REAL ENGLISH DESCRIPTION")
+        else:
+            buffer.write(f"<p>Professional {name} from Wilo for industrial applications.</p>\n")
+        
+        buffer.write(f"<p><strong>Application:</strong> {escape(category, quote=False)}</p>\n")
+        buffer.write(f"<p><strong>Product Type:</strong> {escape(subcategory, quote=False)}</p>\n")
+        
+        if advantages and len(advantages) > 0:
+            buffer.write("<h3>Your Advantages</h3>\n<ul>\n")
+            for advantage in advantages:
+                if advantage and len(advantage.strip()) > 10:
+                    buffer.write(f"<li>{escape(advantage.strip(), quote=False)}</li>\n")
+            buffer.write("</ul>\n")
+            print(f"ADDED {len(advantages)} REAL ADVANTAGES")
+        else:
+            buffer.write(DEFAULT_FEATURES_HTML)
+        
+        # Add technical specifications
+        if table_data and len(table_data) > 0:
+            buffer.write("<h3>Technical Specifications</h3>\n")
+            for table in table_data:
+                table_title = table.get('title', '')
+                table_rows = table.get('data', {})
+                
+                if table_title and table_rows:
+                    buffer.write(f"<h4>{escape(table_title, quote=False)}</h4>\n<ul>\n")
+                    for key, value in table_rows.items():
+                        if key.strip() and value.strip():
+                            buffer.write(f"<li><strong>{escape(key, quote=False)}:</strong> {escape(value, quote=False)}</li>\n")
+                    buffer.write("</ul>\n")
+            print(f"ADDED {len(table_data)} TECHNICAL SPECIFICATION TABLES")
+        
+        buffer.write(ABOUT_WILO_HTML)
+        return buffer.getvalue()
+    
     def create_product(self, product_data):
         """Create product with English text"""
         try:
@@ -63,54 +133,7 @@ class ShopifyClient:
             print(f"Technical Tables: {len(table_data)} tables")
             
             # Build English description
-            html_parts = []
-            html_parts.append(f"<h1>{name}</h1>")
-            
-            if short_description and len(short_description.strip()) > 20:
-                html_parts.append(f"<p>{short_description}</p>")
-                print("ADDED REAL ENGLISH DESCRIPTION")
-            else:
-                html_parts.append(f"<p>Professional {name} from Wilo for industrial applications.</p>")
-            
-            html_parts.append(f"<p><strong>Application:</strong> {category}</p>")
-            html_parts.append(f"<p><strong>Product Type:</strong> {subcategory}</p>")
-            
-            if advantages and len(advantages) > 0:
-                html_parts.append("<h3>Your Advantages</h3>")
-                html_parts.append("<ul>")
-                for advantage in advantages:
-                    if advantage and len(advantage.strip()) > 10:
-                        html_parts.append(f"<li>{advantage.strip()}</li>")
-                html_parts.append("</ul>")
-                print(f"ADDED {len(advantages)} REAL ADVANTAGES")
-            else:
-                html_parts.append("<h3>Key Features</h3>")
-                html_parts.append("<ul>")
-                html_parts.append("<li>High-quality German engineering</li>")
-                html_parts.append("<li>Energy-efficient operation</li>")
-                html_parts.append("<li>Reliable performance for industrial applications</li>")
-                html_parts.append("</ul>")
-            
-            # Add technical specifications
-            if table_data and len(table_data) > 0:
-                html_parts.append("<h3>Technical Specifications</h3>")
-                for table in table_data:
-                    table_title = table.get('title', '')
-                    table_rows = table.get('data', {})
-                    
-                    if table_title and table_rows:
-                        html_parts.append(f"<h4>{table_title}</h4>")
-                        html_parts.append("<ul>")
-                        for key, value in table_rows.items():
-                            if key.strip() and value.strip():
-                                html_parts.append(f"<li><strong>{key}:</strong> {value}</li>")
-                        html_parts.append("</ul>")
-                print(f"ADDED {len(table_data)} TECHNICAL SPECIFICATION TABLES")
-            
-            html_parts.append("<h3>About Wilo</h3>")
-            html_parts.append("<p>Wilo is a leading manufacturer of pumps and pump systems for heating, cooling, air conditioning, water supply and wastewater treatment.</p>")
-            
-            body_html = "\n".join(html_parts)
+            body_html = self._build_description(name, short_description, advantages, category, subcategory, table_data)
             
             # Process images with validation
             valid_images = []
@@ -119,24 +142,29 @@ class ShopifyClient:
             
             print(f"Processing images: card={bool(card_image)}, product={len(product_images)}")
             
+            # Card image first, then up to 15 product images; all URLs are checked concurrently
+            candidates = []
             if card_image:
-                validated = self._validate_image_url(card_image)
-                if validated:
+                candidates.append((card_image, f"{name} - Product Image", "Added validated card image"))
+            for i, img_url in enumerate(product_images[:15]):
+                if img_url:
+                    candidates.append((img_url, f"{name} - Image {i+1}", f"Added validated image {i+1}"))
+            
+            # A URL listed twice is only checked once
+            unique_urls = list(dict.fromkeys(url for url, _, _ in candidates))
+            with ThreadPoolExecutor(max_workers=IMAGE_CHECK_WORKERS) as executor:
+                validated_urls = dict(zip(unique_urls, executor.map(self._validate_image_url, unique_urls)))
+            
+            seen_images = set()
+            for url, alt, message in candidates:
+                validated = validated_urls[url]
+                if validated and validated not in seen_images:
+                    seen_images.add(validated)
                     valid_images.append({
                         'src': validated, 
-                        'alt': f"{name} - Product Image"
+                        'alt': alt
                     })
-                    print("Added validated card image")
-            
-            for i, img_url in enumerate(product_images[:15]):
-                if img_url:
-                    validated = self._validate_image_url(img_url)
-                    if validated and validated not in [img['src'] for img in valid_images]:
-                        valid_images.append({
-                            'src': validated, 
-                            'alt': f"{name} - Image {i+1}"
-                        })
-                        print(f"Added validated image {i+1}")
+                    print(message)
             
             shopify_product = {
                 'title': name,
@@ -161,7 +189,7 @@ class ShopifyClient:
                 print(f"Total images added: {len(valid_images)}")
             
             print("Creating product in Shopify...")
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/products.json",
                 headers=self.headers,
                 json={'product': shopify_product},
@@ -386,31 +414,31 @@ class ShopifyConfig(ttk.LabelFrame):
             self.after(0, lambda: self.progress_var.set("Upload completed"))
     
     def _display_results(self, successful, failed):
-        self.results_text.config(state='normal')
-        self.results_text.delete(1.0, tk.END)
-        
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.results_text.insert(tk.END, f"=== UPLOAD RESULTS - {timestamp} ===\n\n")
-        
-        self.results_text.insert(tk.END, f"Total: {len(successful) + len(failed)}\n")
-        self.results_text.insert(tk.END, f"Successful: {len(successful)}\n")
-        self.results_text.insert(tk.END, f"Failed: {len(failed)}\n\n")
+        parts = [
+            f"=== UPLOAD RESULTS - {timestamp} ===\n\n",
+            f"Total: {len(successful) + len(failed)}\n",
+            f"Successful: {len(successful)}\n",
+            f"Failed: {len(failed)}\n\n",
+        ]
         
         if successful:
-            self.results_text.insert(tk.END, "=== SUCCESSFUL ===\n")
+            parts.append("=== SUCCESSFUL ===\n")
             for item in successful:
                 product = item['product']
                 shopify_id = item['shopify_id']
-                self.results_text.insert(tk.END, f"✅ {product.get('name', 'Unknown')} (ID: {shopify_id})\n")
-            self.results_text.insert(tk.END, "\n")
+                parts.append(f"✅ {product.get('name', 'Unknown')} (ID: {shopify_id})\n")
+            parts.append("\n")
         
         if failed:
-            self.results_text.insert(tk.END, "=== FAILED ===\n")
+            parts.append("=== FAILED ===\n")
             for item in failed:
                 product = item['product']
                 error = item.get('error', 'Unknown error')
-                self.results_text.insert(tk.END, f"❌ {product.get('name', 'Unknown')} - {error}\n")
+                parts.append(f"❌ {product.get('name', 'Unknown')} - {error}\n")
         
+        self.results_text.config(state='normal')
+        self.results_text.replace(1.0, tk.END, ''.join(parts))
         self.results_text.config(state='disabled')
         
         if len(failed) == 0:
@@ -434,7 +462,7 @@ class ShopifyConfig(ttk.LabelFrame):
             return
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open(file_path, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
                 json.dump(products, f, indent=2, ensure_ascii=False)
             messagebox.showinfo("Exported", f"{len(products)} products exported successfully!")
         except Exception as e:
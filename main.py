@@ -5,12 +5,23 @@ Wilo Product Scraper - Main Entry Point
 
 import sys
 import os
+import argparse
 import tkinter as tk
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Wilo Product Scraper")
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help="Re-scrape every product, ignoring the cache of already-scraped pages"
+    )
+    return parser.parse_args()
+
 def main():
     """Main application entry point"""
     try:
@@ -18,8 +29,11 @@ def main():
         from utils.logger import setup_logging, get_logger
         from gui.main_window import MainWindow
         
+        args = parse_args()
+        
         # Load settings first
         settings = AppSettings()
+        settings.force_rescrape = args.force
         
         # Setup logging with proper level
         setup_logging()  # Use default INFO level
@@ -2,41 +2,150 @@
 Simple Browser Manager - Just Open Chrome
 """
 
+import os
+import json
 import time
+import atexit
+import threading
 import subprocess
+from collections import deque
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
 from utils.logger import get_logger
 
+# Upper bound for driver.get() before Selenium gives up on a page (seconds)
+PAGE_LOAD_TIMEOUT = 90
+
+# Image files; their URLs are read from DOM attributes, so the pixels are never needed
+IMAGE_RESOURCE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg"]
+
+# Resources a text-only browser never looks at. Stylesheets stay enabled because
+# visibility and clickability checks depend on layout.
+BLOCKED_RESOURCE_PATTERNS = IMAGE_RESOURCE_PATTERNS + [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+
+# How long wait_idle() sleeps between reads of the DevTools page events (seconds)
+IDLE_POLL_INTERVAL = 0.1
+
+# Extra wait for networkIdle once driver.get() has returned with the document complete (seconds).
+# Kept short: pages with long-polling, beacons or chat widgets may never go idle.
+NAVIGATION_IDLE_TIMEOUT = 2.5
+
 class BrowserManager:
     """Super simple browser manager - just open Chrome"""
     
-    def __init__(self, settings):
+    # Browsers kept open for the lifetime of the process, keyed by profile name
+    _shared = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, settings, profile_name: str = "main", text_only: bool = False):
         self.settings = settings
+        self.profile_name = profile_name
         self.driver = None
+        self.launched_headless = None
+        
+        # Browsers nobody watches only need the DOM: image URLs are read from attributes,
+        # so the pixels never need to download
+        self.text_only_requested = text_only
+        self.text_only = text_only or getattr(settings, 'headless_mode', False)
         self.logger = get_logger(__name__)
         
+        # Recent step screenshots kept in memory; written out only when something fails
+        self.screenshot_buffer = deque(maxlen=20)
+    
+    @classmethod
+    def shared(cls, settings, profile_name: str = "main"):
+        """Process-wide browser for a profile, so later scrapes skip Chrome start-up"""
+        with cls._shared_lock:
+            browser = cls._shared.get(profile_name)
+            if browser is None:
+                browser = cls._shared[profile_name] = cls(settings, profile_name)
+            browser.settings = settings
+            return browser
+    
+    @classmethod
+    def quit_shared(cls):
+        """Close every process-wide browser"""
+        with cls._shared_lock:
+            for browser in cls._shared.values():
+                browser.quit()
+    
+    def is_alive(self) -> bool:
+        """True if the Chrome session still answers"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            self.logger.info("Chrome session is gone, a new one will be started")
+            self.driver = None
+            return False
+        
     def setup_driver(self) -> bool:
         """Simple Chrome setup - no fancy stuff"""
         try:
+            headless = getattr(self.settings, 'headless_mode', False)
+            
+            # A browser left open by an earlier scrape is reused as long as its mode still matches
+            if self.is_alive():
+                if self.launched_headless == headless:
+                    self.logger.info("♻️  Reusing the open Chrome session")
+                    return True
+                self.quit()
+            
             self.logger.info("Setting up Chrome browser (simple mode)...")
+            self.text_only = self.text_only_requested or headless
+            self.launched_headless = headless
             
             # Simple Chrome options
             options = Options()
             
-            # Only essential options
-            if getattr(self.settings, 'headless_mode', False):
-                options.add_argument('--headless')
+            # Only essential options; a headless browser has nothing to draw, so it skips the GPU process
+            if headless:
+                options.add_argument('--headless=new')
+                options.add_argument('--disable-gpu')
+            
+            prefs = {"profile.default_content_setting_values.notifications": 2}
+            if self.text_only:
+                prefs["profile.managed_default_content_settings.images"] = 2
+            options.add_experimental_option("prefs", prefs)
+            
+            # Page lifecycle events (networkIdle) are read back from the performance log;
+            # network events are left out so the log stays small
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': False, 'enablePage': True})
                 
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--window-size=1920,1080')
             
+            # Lighter start-up: no extensions, first-run checks or background tasks in a scraping profile
+            options.add_argument('--disable-extensions')
+            options.add_argument('--no-first-run')
+            options.add_argument('--no-default-browser-check')
+            options.add_argument('--disable-background-networking')
+            
+            # Persistent profile keeps the HTTP cache and cookies warm between runs.
+            # Chrome locks a profile while it is open, so every browser gets its own.
+            profile_root = getattr(self.settings, 'browser_profile_dir', '')
+            if profile_root:
+                profile_dir = Path(profile_root).expanduser() / self.profile_name
+                profile_dir.mkdir(parents=True, exist_ok=True)
+                options.add_argument(f'--user-data-dir={profile_dir}')
+                options.add_argument(f'--disk-cache-dir={profile_dir / "cache"}')
+            
             # Try the simplest approach - let Selenium handle everything
             try:
                 self.logger.info("Trying simple Chrome setup...")
                 self.driver = webdriver.Chrome(options=options)
+                self._configure_timeouts()
                 
                 # Quick test
                 self.driver.get("data:text/html,<h1>Test</h1>")
@@ -52,6 +161,7 @@ class BrowserManager:
                     self.logger.info("Trying with empty service...")
                     service = Service()
                     self.driver = webdriver.Chrome(service=service, options=options)
+                    self._configure_timeouts()
                     
                     self.driver.get("data:text/html,<h1>Test</h1>")
                     if "Test" in self.driver.page_source:
@@ -70,6 +180,7 @@ class BrowserManager:
                         if subprocess.run(["test", "-f", chrome_path], capture_output=True).returncode == 0:
                             options.binary_location = chrome_path
                             self.driver = webdriver.Chrome(options=options)
+                            self._configure_timeouts()
                             
                             self.driver.get("data:text/html,<h1>Test</h1>")
                             if "Test" in self.driver.page_source:
@@ -87,10 +198,87 @@ class BrowserManager:
             self.logger.error(f"Browser setup completely failed: {e}")
             return False
     
+    def _configure_timeouts(self):
+        """Apply driver-wide timeouts right after the browser starts"""
+        # Selector probes are expected to miss often; never let them block on an implicit wait
+        self.driver.implicitly_wait(0)
+        self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        
+        try:
+            self.driver.execute_cdp_cmd("Page.enable", {})
+            self.driver.execute_cdp_cmd("Page.setLifecycleEventsEnabled", {"enabled": True})
+        except WebDriverException as e:
+            self.logger.debug(f"Page lifecycle events not available: {e}")
+        
+        if self.text_only:
+            self._block_heavy_resources()
+    
+    def _block_heavy_resources(self):
+        """Stop a text-only browser from downloading images, fonts, video and trackers"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS})
+        except WebDriverException as e:
+            self.logger.debug(f"Resource blocking not available: {e}")
+    
+    def set_images_blocked(self, blocked: bool):
+        """Block or allow image downloads in the current tab; other tabs keep their own setting"""
+        if not self.driver or self.text_only:
+            return
+        
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": IMAGE_RESOURCE_PATTERNS if blocked else []})
+        except WebDriverException as e:
+            self.logger.debug(f"Image blocking not available: {e}")
+    
     def get_driver(self):
         """Get the driver"""
         return self.driver
     
+    def clear_page_events(self):
+        """Drop lifecycle events of earlier pages so wait_idle() only sees the next one"""
+        try:
+            self.driver.get_log('performance')
+        except WebDriverException as e:
+            self.logger.debug(f"Performance log not available: {e}")
+    
+    def top_frame_id(self):
+        """DevTools id of the current page's main frame, or None when unavailable"""
+        try:
+            return self.driver.execute_cdp_cmd("Page.getFrameTree", {})['frameTree']['frame']['id']
+        except (WebDriverException, KeyError) as e:
+            self.logger.debug(f"Frame tree not available: {e}")
+            return None
+    
+    def wait_idle(self, timeout: float = NAVIGATION_IDLE_TIMEOUT, frame_id: str = None) -> bool:
+        """Wait for Chrome's networkIdle lifecycle event of the given frame (the main frame by default);
+        False on timeout or when events are unavailable"""
+        frame_id = frame_id or self.top_frame_id()
+        if not frame_id:
+            return False
+        
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                entries = self.driver.get_log('performance')
+            except WebDriverException as e:
+                self.logger.debug(f"Performance log not available: {e}")
+                return False
+            
+            for entry in entries:
+                message = json.loads(entry['message']).get('message', {})
+                if message.get('method') != 'Page.lifecycleEvent':
+                    continue
+                # An iframe going idle says nothing about the main document
+                params = message.get('params', {})
+                if params.get('name') == 'networkIdle' and params.get('frameId') == frame_id:
+                    return True
+            time.sleep(IDLE_POLL_INTERVAL)
+        
+        self.logger.debug(f"No networkIdle event within {timeout}s")
+        return False
+    
     def navigate_to(self, url: str) -> bool:
         """Navigate to URL"""
         try:
@@ -98,8 +286,10 @@ class BrowserManager:
                 return False
                 
             self.logger.info(f"Going to: {url}")
+            self.clear_page_events()
+            # get() returns once readyState is 'complete'; only late XHRs are left to settle
             self.driver.get(url)
-            time.sleep(3)  # Simple wait
+            self.wait_idle()
             return True
             
         except Exception as e:
@@ -114,7 +304,6 @@ class BrowserManager:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 filename = f"screenshot_{timestamp}.png"
             
-            import os
             os.makedirs("logs/screenshots", exist_ok=True)
             filepath = f"logs/screenshots/{filename}"
             
@@ -127,6 +316,51 @@ class BrowserManager:
             self.logger.error(f"Screenshot failed: {e}")
             return ""
     
+    def capture_screenshot(self, filename: str):
+        """Keep a screenshot in memory instead of writing it to disk"""
+        try:
+            if self.driver:
+                self.screenshot_buffer.append((filename, self.driver.get_screenshot_as_png()))
+        except WebDriverException as e:
+            self.logger.debug(f"Screenshot capture failed: {e}")
+    
+    def flush_screenshots(self):
+        """Write buffered screenshots to disk"""
+        if not self.screenshot_buffer:
+            return
+        
+        try:
+            os.makedirs("logs/screenshots", exist_ok=True)
+            while self.screenshot_buffer:
+                filename, png = self.screenshot_buffer.popleft()
+                with open(f"logs/screenshots/{filename}", 'wb') as f:
+                    f.write(png)
+            self.logger.info("Buffered screenshots written to logs/screenshots")
+        except OSError as e:
+            self.logger.error(f"Failed to write buffered screenshots: {e}")
+    
+    def reset(self):
+        """Return the browser to a blank page for the next scrape instead of closing it"""
+        if not self.driver:
+            return
+        
+        try:
+            handles = self.driver.window_handles
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(handles[0])
+            self.set_images_blocked(False)
+            
+            # Cookies are kept on purpose: the persistent profile carries consent and session
+            # cookies into the next run, so the cookie banner does not come back every time
+            self.driver.get("about:blank")
+            self.screenshot_buffer.clear()
+            self.logger.info("♻️  Browser reset for the next run")
+        except WebDriverException as e:
+            self.logger.debug(f"Reset failed, closing browser: {e}")
+            self.quit()
+    
     def quit(self):
         """Close browser"""
         if self.driver:
@@ -134,7 +368,10 @@ class BrowserManager:
                 self.logger.info("Closing browser...")
                 self.driver.quit()
                 self.logger.info("✅ Browser closed")
-            except:
-                pass
+            except WebDriverException as e:
+                self.logger.debug(f"Browser already closed: {e}")
             finally:
                 self.driver = None
+
+# Shared browsers outlive each scrape but not the application
+atexit.register(BrowserManager.quit_shared)
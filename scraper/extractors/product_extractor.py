@@ -3,6 +3,7 @@ Product data extraction logic
 """
 
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 from utils.logger import get_logger
 from datetime import datetime
 from typing import Dict, Optional
@@ -36,7 +37,7 @@ class ProductExtractor:
                         if name_element.text.strip():
                             data['name'] = name_element.text.strip()
                             break
-                    except:
+                    except (NoSuchElementException, StaleElementReferenceException):
                         continue
                 
                 if 'name' not in data:
@@ -46,69 +47,58 @@ class ProductExtractor:
                 data['name'] = "Unknown Product"
                 self.logger.warning(f"Failed to extract product name: {e}")
             
-            # Extract specifications
+            # Extract specifications; a row re-rendered while it is read is skipped, not the whole product
             specs = {}
-            try:
-                spec_elements = driver.find_elements(By.XPATH, "//table//tr")
-                for row in spec_elements:
-                    try:
-                        cells = row.find_elements(By.XPATH, ".//td")
-                        if len(cells) >= 2:
-                            key = cells[0].text.strip()
-                            value = cells[1].text.strip()
-                            if key and value:
-                                specs[key] = value
-                    except:
-                        continue
-            except:
-                pass
+            spec_elements = driver.find_elements(By.XPATH, "//table//tr")
+            for row in spec_elements:
+                try:
+                    cells = row.find_elements(By.XPATH, ".//td")
+                    if len(cells) >= 2:
+                        key = cells[0].text.strip()
+                        value = cells[1].text.strip()
+                        if key and value:
+                            specs[key] = value
+                except (NoSuchElementException, StaleElementReferenceException):
+                    continue
             
             data['specifications'] = specs
             
             # Extract price
-            try:
-                price_selectors = [
-                    "//*[contains(@class, 'price')]",
-                    "//*[contains(text(), '€')]",
-                    "//*[contains(text(), '$')]"
-                ]
-                
-                for selector in price_selectors:
-                    try:
-                        price_element = driver.find_element(By.XPATH, selector)
-                        if price_element.text.strip():
-                            data['price'] = price_element.text.strip()
-                            break
-                    except:
-                        continue
-                
-                if 'price' not in data:
-                    data['price'] = "Price not available"
-                    
-            except:
+            price_selectors = [
+                "//*[contains(@class, 'price')]",
+                "//*[contains(text(), '€')]",
+                "//*[contains(text(), '$')]"
+            ]
+            
+            for selector in price_selectors:
+                try:
+                    price_element = driver.find_element(By.XPATH, selector)
+                    if price_element.text.strip():
+                        data['price'] = price_element.text.strip()
+                        break
+                except (NoSuchElementException, StaleElementReferenceException):
+                    continue
+            
+            if 'price' not in data:
                 data['price'] = "Price not available"
             
             # Extract description
-            try:
-                desc_selectors = [
-                    "//div[@class='description']",
-                    "//*[contains(@class, 'desc')]",
-                    "//p[contains(@class, 'description')]"
-                ]
-                
-                for selector in desc_selectors:
-                    try:
-                        desc_element = driver.find_element(By.XPATH, selector)
-                        if desc_element.text.strip():
-                            data['description'] = desc_element.text.strip()
-                            break
-                    except:
-                        continue
-                
-                if 'description' not in data:
-                    data['description'] = ""
-                    
-            except:
+            desc_selectors = [
+                "//div[@class='description']",
+                "//*[contains(@class, 'desc')]",
+                "//p[contains(@class, 'description')]"
+            ]
+            
+            for selector in desc_selectors:
+                try:
+                    desc_element = driver.find_element(By.XPATH, selector)
+                    if desc_element.text.strip():
+                        data['description'] = desc_element.text.strip()
+                        break
+                except (NoSuchElementException, StaleElementReferenceException):
+                    continue
+            
+            if 'description' not in data:
                 data['description'] = ""
             
             # Extract images
@@ -120,7 +110,7 @@ class ProductExtractor:
                         for img in img_elements 
                         if img.get_attribute('src')
                     ]
-                except:
+                except StaleElementReferenceException:
                     data['images'] = []
             else:
                 data['images'] = []
@@ -5,9 +5,13 @@ Category handling logic
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException
+from scraper.navigation.page_state import wait_until_settled
 from utils.logger import get_logger
 from typing import List, Dict
-import time
+
+# Trimmed text of a list of elements in one WebDriver call instead of one .text per element
+JS_ELEMENT_TEXTS = "return arguments[0].map(function (e) { return (e.innerText || '').trim(); });"
 
 class CategoryHandler:
     """Handles category detection and selection"""
@@ -24,31 +28,31 @@ class CategoryHandler:
             # Try dropdown approach
             try:
                 category_elements = driver.find_elements(By.XPATH, "//ul[@class='rcbList']//li")
-                for elem in category_elements:
-                    text = elem.text.strip()
+                texts = driver.execute_script(JS_ELEMENT_TEXTS, category_elements) if category_elements else []
+                for elem, text in zip(category_elements, texts):
                     if text:
                         categories.append({
                             'name': text,
                             'element': elem,
                             'type': 'dropdown'
                         })
-            except:
-                pass
+            except NoSuchElementException as e:
+                self.logger.debug(f"No dropdown categories: {e}")
             
             # Try tree approach if dropdown failed
             if not categories:
                 try:
                     tree_items = driver.find_elements(By.XPATH, "//ul[@class='jstree-children']//a")
-                    for elem in tree_items:
-                        text = elem.text.strip()
+                    texts = driver.execute_script(JS_ELEMENT_TEXTS, tree_items) if tree_items else []
+                    for elem, text in zip(tree_items, texts):
                         if text:
                             categories.append({
                                 'name': text,
                                 'element': elem,
                                 'type': 'tree'
                             })
-                except:
-                    pass
+                except NoSuchElementException as e:
+                    self.logger.debug(f"No tree categories: {e}")
             
             self.logger.info(f"Found {len(categories)} categories")
             return categories
@@ -61,11 +65,10 @@ class CategoryHandler:
         """Select a specific category"""
         try:
             element = category['element']
-            driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(1)
-            driver.execute_script("arguments[0].click();", element)
+            driver.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();", element)
             
-            time.sleep(self.settings.scraping.delay_between_actions)
+            if not wait_until_settled(driver, element):
+                self.logger.warning(f"Page still loading after selecting {category['name']}")
             self.logger.info(f"Selected category: {category['name']}")
             return True
             
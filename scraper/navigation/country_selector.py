@@ -5,8 +5,17 @@ Country selection navigation logic
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from config.countries import COUNTRIES
+from scraper.navigation.page_state import wait_until_settled
 from utils.logger import get_logger
-import time
+
+# Polling interval for explicit waits (seconds)
+WAIT_POLL_FREQUENCY = 0.2
 
 class CountryNavigator:
     """Handles country selection navigation"""
@@ -14,36 +23,52 @@ class CountryNavigator:
     def __init__(self, settings):
         self.settings = settings
         self.logger = get_logger(__name__)
+        
+        # Locators for every known country, built once instead of per call
+        self.country_locators = {
+            config['name']: self._build_locator(config['name']) for config in COUNTRIES.values()
+        }
+        
+        # One wait per driver, reused across selections
+        self.wait = None
+        self.wait_driver = None
+    
+    @staticmethod
+    def _build_locator(country: str):
+        """Country button by value attribute or by label text, as one XPath union"""
+        return (By.XPATH, f"//button[@value='{country}'] | //button[contains(.//span, '{country}')]")
+    
+    def _get_wait(self, driver):
+        """Return the explicit wait bound to this driver"""
+        if self.wait is None or self.wait_driver is not driver:
+            self.wait = WebDriverWait(
+                driver, 20,
+                poll_frequency=WAIT_POLL_FREQUENCY,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+            )
+            self.wait_driver = driver
+        return self.wait
     
     def select_country(self, driver, country: str) -> bool:
         """Select a country from the list"""
         try:
             self.logger.info(f"Selecting country: {country}")
-            wait = WebDriverWait(driver, 20)
+            wait = self._get_wait(driver)
             
-            # Strategy 1: Find button by value attribute
-            try:
-                country_button = wait.until(
-                    EC.element_to_be_clickable((By.XPATH, f"//button[@value='{country}']"))
-                )
-                driver.execute_script("arguments[0].click();", country_button)
-                self.logger.info("Country selected via button value")
-                time.sleep(self.settings.scraping.delay_between_actions)
-                return True
-            except:
-                pass
+            locator = self.country_locators.get(country)
+            if locator is None:
+                locator = self.country_locators[country] = self._build_locator(country)
             
-            # Strategy 2: Find button by text content  
+            # Value and text strategies share a single wait, so a miss costs one timeout instead of two
             try:
-                country_button = wait.until(
-                    EC.element_to_be_clickable((By.XPATH, f"//button[contains(.//span, '{country}')]"))
-                )
+                country_button = wait.until(EC.element_to_be_clickable(locator))
                 driver.execute_script("arguments[0].click();", country_button)
-                self.logger.info("Country selected via button text")
-                time.sleep(self.settings.scraping.delay_between_actions)
+                self.logger.info("Country selected")
+                if not wait_until_settled(driver, country_button):
+                    self.logger.warning("Page still loading after country selection")
                 return True
-            except:
-                pass
+            except TimeoutException:
+                self.logger.debug(f"Country button for {country} not clickable")
             
             return False
             
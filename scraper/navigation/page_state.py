@@ -0,0 +1,34 @@
+"""
+Page readiness checks shared by the navigators
+"""
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+# Document loaded and no jQuery or ASP.NET AJAX request in flight
+JS_PAGE_SETTLED = """
+return document.readyState === 'complete'
+    && (!window.jQuery || window.jQuery.active === 0)
+    && !(window.Sys && Sys.WebForms && Sys.WebForms.PageRequestManager
+         && Sys.WebForms.PageRequestManager.getInstance().get_isInAsyncPostBack());
+"""
+
+# How long a clicked element gets to detach before we assume the action was in-page (seconds)
+NAVIGATION_GRACE = 0.5
+
+def wait_until_settled(driver, clicked=None, timeout: int = 30) -> bool:
+    """Wait for the page to settle after an action instead of sleeping a fixed delay"""
+    if clicked is not None:
+        try:
+            WebDriverWait(driver, NAVIGATION_GRACE, poll_frequency=0.1).until(EC.staleness_of(clicked))
+        except TimeoutException:
+            pass
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(JS_PAGE_SETTLED)
+        )
+        return True
+    except TimeoutException:
+        return False
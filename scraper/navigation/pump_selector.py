@@ -2,11 +2,74 @@
 Pump selection navigation logic
 """
 
-from selenium.webdriver.common.by import By
+import json
+from pathlib import Path
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from utils.logger import get_logger
-import time
+
+# Lowercase keywords identifying the hydraulic pump selection tile
+PUMP_KEYWORDS = ('pumpenauswahl', 'pump selection')
+
+# Case-insensitive text() for XPath 1.0
+_LOWER_TEXT = "translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÜ', 'abcdefghijklmnopqrstuvwxyzäöü')"
+
+# Label of the hydraulic pump selection tile - all keywords in one query
+PUMP_LABEL_XPATH = (
+    "//span["
+    + " or ".join(f"contains({_LOWER_TEXT}, '{keyword}')" for keyword in PUMP_KEYWORDS)
+    + "]"
+)
+
+# Resolved tile selectors from earlier runs, so the keyword search can be skipped
+SELECTOR_CACHE_PATH = Path.home() / '.wilo_cache' / 'selectors.json'
+
+# Finds the first visible label and climbs to its clickable tile in one browser call.
+# A cached CSS selector (arguments[1]) is tried first and only trusted if it is visible
+# and still carries one of the keywords (arguments[2]).
+JS_FIND_PUMP_TILE = """
+if (arguments[1]) {
+    var cached = document.querySelector(arguments[1]);
+    if (cached && (cached.offsetWidth || cached.offsetHeight)) {
+        var cachedText = (cached.textContent || '').toLowerCase();
+        if (arguments[2].some(function (keyword) { return cachedText.indexOf(keyword) !== -1; })) return cached;
+    }
+}
+var snapshot = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+var clickable = ['A', 'BUTTON', 'DIV', 'TD'];
+for (var i = 0; i < snapshot.snapshotLength; i++) {
+    var label = snapshot.snapshotItem(i);
+    if (!(label.offsetWidth || label.offsetHeight)) continue;
+    var node = label.parentElement;
+    var fallback = null;
+    for (var level = 0; node && level < 5; level++, node = node.parentElement) {
+        if (node.classList.contains('tileButton')) return node;
+        if (!fallback && clickable.indexOf(node.tagName) !== -1) fallback = node;
+    }
+    if (fallback) return fallback;
+}
+return null;
+"""
+
+# Builds a unique CSS path for an element (ids where available, nth-child otherwise)
+JS_CSS_PATH = """
+var node = arguments[0], path = [];
+while (node && node.nodeType === 1 && node !== document.documentElement) {
+    if (node.id) { path.unshift('#' + CSS.escape(node.id)); break; }
+    var index = Array.prototype.indexOf.call(node.parentElement.children, node) + 1;
+    path.unshift(node.tagName.toLowerCase() + ':nth-child(' + index + ')');
+    node = node.parentElement;
+}
+return path.join(' > ');
+"""
+
+# Polling interval for explicit waits (seconds)
+WAIT_POLL_FREQUENCY = 0.25
 
 class PumpNavigator:
     """Handles pump selection navigation"""
@@ -14,30 +77,60 @@ class PumpNavigator:
     def __init__(self, settings):
         self.settings = settings
         self.logger = get_logger(__name__)
+        self.cached_selector = self._load_cached_selector()
+    
+    def _load_cached_selector(self):
+        """Read the pump tile selector remembered from a previous run"""
+        try:
+            with open(SELECTOR_CACHE_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f).get('pump_tile')
+        except (OSError, ValueError):
+            return None
+    
+    def _save_cached_selector(self, selector):
+        """Remember the pump tile selector for the next run"""
+        try:
+            SELECTOR_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(SELECTOR_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump({'pump_tile': selector}, f)
+            self.cached_selector = selector
+        except OSError as e:
+            self.logger.debug(f"Could not save pump tile selector: {e}")
+    
+    def _find_pump_tile(self, driver):
+        """Wait condition: first displayed pump selection tile, or False"""
+        return driver.execute_script(JS_FIND_PUMP_TILE, PUMP_LABEL_XPATH, self.cached_selector, list(PUMP_KEYWORDS)) or False
     
     def navigate_to_pump_selection(self, driver) -> bool:
         """Navigate to hydraulic pump selection"""
         try:
             self.logger.info("Navigating to pump selection...")
-            wait = WebDriverWait(driver, 20)
+            wait = WebDriverWait(
+                driver, 30,
+                poll_frequency=WAIT_POLL_FREQUENCY,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+            )
             
-            # Find the tile with "Hydraulische Pumpenauswahl"
+            # Find the tile with "Hydraulische Pumpenauswahl" - returns as soon as it is shown
             try:
-                pump_element = wait.until(
-                    EC.element_to_be_clickable((By.XPATH, 
-                        "//span[contains(text(), 'Hydraulische Pumpenauswahl')]//ancestor::div[contains(@class, 'tileButton')]"
-                    ))
-                )
+                pump_element = wait.until(self._find_pump_tile)
+                
+                selector = driver.execute_script(JS_CSS_PATH, pump_element)
+                if selector and selector != self.cached_selector:
+                    self._save_cached_selector(selector)
+                
+                driver.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();", pump_element)
                 
-                driver.execute_script("arguments[0].scrollIntoView(true);", pump_element)
-                time.sleep(1)
-                driver.execute_script("arguments[0].click();", pump_element)
+                # The click posts back; wait for the old tile to go away instead of a fixed delay
+                try:
+                    wait.until(EC.staleness_of(pump_element))
+                except TimeoutException:
+                    self.logger.debug("Pump tile still attached after click, continuing")
                 
                 self.logger.info("Pump selection successful")
-                time.sleep(self.settings.scraping.delay_between_actions)
                 return True
                 
-            except Exception as e:
+            except TimeoutException as e:
                 self.logger.error(f"Failed to find pump selection tile: {e}")
                 return False
                 
@@ -2,27 +2,274 @@
 Enhanced Wilo Catalog Scraper with Produktauswahl navigation and table extraction
 """
 
+import io
+import html
+import logging
 import time
 import re
+import queue
+import threading
+import requests
+from urllib.parse import urljoin, urlsplit
+from dataclasses import dataclass
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from lxml import etree, html as lxml_html
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from scraper.browser_manager import BrowserManager
 from utils.logger import get_logger
+from utils.scrape_cache import ScrapeCache
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Runs of whitespace collapsed to a single space in extracted text
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Present in the raw HTML only when the product page is rendered server-side
+STATIC_CONTENT_MARKER = "cl-your-advantages"
+
+# Visible text of every node matching each XPath in a list, read in a single WebDriver round-trip.
+# Only texts longer than the matching entry of arguments[1] are sent back.
+JS_VISIBLE_TEXTS = """
+var minLengths = arguments[1];
+return arguments[0].map(function (xpath, index) {
+    var snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var texts = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) {
+        var node = snapshot.snapshotItem(i);
+        var text = node.getClientRects().length ? (node.innerText || '').trim() : '';
+        if (text.length > minLengths[index]) texts.push(text);
+    }
+    return texts;
+});
+"""
+
+# Name, image and link of a catalog card as one object.
+# img.src and a.href are already absolute, so no URL fix-ups are needed afterwards.
+JS_READ_CARD = """
+function readCard(card) {
+    var heading = card.querySelector('.card-footer h3') || card.querySelector('h3');
+    var image = card.querySelector('img');
+    var link = card.querySelector('a.stretched-link') || card.querySelector("a[class*='stretched']") || card.querySelector('a[href]');
+    return {
+        name: heading ? heading.textContent.trim() : '',
+        card_image_url: image ? image.src : '',
+        product_link: link ? link.href : ''
+    };
+}
+"""
+# ...for the first N cards on the page, or for one card element, in a single WebDriver round-trip
+JS_CARD_DATA = JS_READ_CARD + "return Array.from(document.querySelectorAll('div.card.cl-overview')).slice(0, arguments[0]).map(readCard);"
+JS_ONE_CARD_DATA = JS_READ_CARD + "return readCard(arguments[0]);"
+
+# Type and URL of the media inside a carousel element, read in a single WebDriver round-trip.
+# arguments[0] is the element itself or a CSS selector for it; images win over embedded videos.
+JS_MEDIA_SOURCE = """
+var root = typeof arguments[0] === 'string' ? document.querySelector(arguments[0]) : arguments[0];
+if (!root) return null;
+var img = root.querySelector('img[src], img[data-src], img[srcset]');
+if (img) {
+    var src = (img.getAttribute('src') && img.src) || img.getAttribute('data-src') || '';
+    var srcset = img.getAttribute('srcset');
+    if (!src && srcset) {
+        var parts = srcset.split(',').map(function (part) { return part.trim(); }).filter(Boolean);
+        if (parts.length) src = parts[parts.length - 1].split(' ')[0];
+    }
+    return ['image', src];
+}
+var iframe = root.querySelector('iframe[src]');
+return iframe ? ['video', iframe.src] : null;
+"""
+ACTIVE_SLIDE_CSS = "div.carousel-inner div.carousel-item.active"
+CAROUSEL_CSS = "div.carousel-inner"
+
+# Elements that tell us a page is ready for the next step
+CATALOG_CARD_XPATH = "//div[contains(@class, 'card') and contains(@class, 'cl-overview')]"
+PRODUCT_HEADING_XPATH = "//h1"
+
+# The product title heading, or the first h1 when the page has none. A plain union
+# returns matches in document order, so the fallback half only matches when the title is missing.
+PRODUCT_NAME_XPATH = "(//h1[@class='m-0'])[1] | (//h1)[1][not(//h1[@class='m-0'])]"
+SPEC_TABLE_XPATH = "//table"
+RANGE_TABLE_ROW_XPATH = "//*[@id='range_productlist']//tbody//tr"
+SPEC_TABLES_XPATH = "//div[contains(@class, 'cl-card-table-simple')]//table[@class='cl-table-simple']"
+
+# Parts of a spec table and of the media carousel, relative to their container
+TABLE_HEADER_XPATH = ".//thead//th"
+TABLE_ROW_XPATH = ".//tbody//tr"
+ROW_CELL_XPATH = ".//td"
+CARD_IMAGE_SRC_XPATH = ".//img/@src"
+THUMBNAIL_XPATH = "//div[contains(@class,'cl-image-preview')][.//img]"
+
+# XPath selectors, tried in order until one matches
+CARD_SELECTORS = (
+    "//div[contains(@class, 'card cl-overview h-100 rebrush')]",
+    "//div[contains(@class, 'card') and contains(@class, 'cl-overview')]",
+)
+CARD_LINK_SELECTORS = (
+    ".//a[@class='stretched-link']",
+    ".//a[contains(@class, 'stretched')]",
+    ".//a[@href]",
+)
+CARD_NAME_XPATH = ".//div[contains(@class, 'card-footer')]//h3 | .//h3"
+PRODUKTAUSWAHL_TAB_SELECTORS = (
+    "//li[@class='nav-item']//a[contains(@href, '#range_productlist') and contains(text(), 'Produktauswahl')]",
+    "//a[contains(@href, '#range_productlist')]",
+    "//a[contains(text(), 'Produktauswahl')]",
+)
+RANGE_FIRST_PRODUCT_SELECTORS = (
+    "//table//tbody//tr[1]//td[1]//a",
+    "//tbody//tr[1]//td[1]//a",
+    "//tr[1]//td[1]//a",
+)
+# Capped at the first 4 tables in the XPath itself, so the driver never returns more
+FALLBACK_TABLE_SELECTORS = (
+    "(//table)[position() <= 4]",
+    "(//div[contains(@class, 'table')]//table)[position() <= 4]",
+    "(//div[contains(@class, 'row')]//table)[position() <= 4]",
+)
+SHORT_DESCRIPTION_SELECTORS = (
+    "//div[@class='pl-md-8 col']//h3",
+    "//div[@class='pl-md-8 col']//div//p",
+    "//div[contains(@class, 'pl-md-8')]//h3",
+    "//div[contains(@class, 'pl-md-8')]//p",
+)
+ADVANTAGES_SELECTORS = (
+    "//div[@class='cl-your-advantages']//ul//li",
+    "//div[contains(@class, 'cl-your-advantages')]//li",
+    "//h3[contains(text(), 'Ihre Vorteile')]//following-sibling::div//li",
+)
+LONG_DESCRIPTION_SELECTORS = (
+    "//div[contains(@class, 'text-module')]//div[contains(@class, 'text-wrapper')]//p",
+    "//div[contains(@class, 'page-module')]//div[contains(@class, 'text-wrapper')]",
+)
+DESCRIPTION_SELECTORS = SHORT_DESCRIPTION_SELECTORS + ADVANTAGES_SELECTORS + LONG_DESCRIPTION_SELECTORS
+
+# Compiled once for the static HTML path; lxml serializes concurrent calls on each object
+STATIC_XPATHS = {selector: etree.XPath(selector) for selector in DESCRIPTION_SELECTORS}
+STATIC_CATALOG_CARDS = etree.XPath(CATALOG_CARD_XPATH)
+STATIC_CARD_HEADINGS = etree.XPath(CARD_NAME_XPATH)
+STATIC_CARD_IMAGE_SRC = etree.XPath(CARD_IMAGE_SRC_XPATH)
+STATIC_CARD_LINK_HREFS = tuple(etree.XPath(f"{selector}/@href") for selector in CARD_LINK_SELECTORS)
+STATIC_SPEC_TABLES = etree.XPath(SPEC_TABLES_XPATH)
+STATIC_TABLE_HEADERS = etree.XPath(TABLE_HEADER_XPATH)
+STATIC_TABLE_ROWS = etree.XPath(TABLE_ROW_XPATH)
+STATIC_ROW_CELLS = etree.XPath(ROW_CELL_XPATH)
+STATIC_PRODUCT_HEADINGS = etree.XPath(PRODUCT_NAME_XPATH)
+STATIC_CAROUSEL_ITEMS = etree.XPath("//div[contains(@class, 'carousel-inner')]//div[contains(@class, 'carousel-item')]")
+STATIC_SLIDE_IMAGES = etree.XPath(".//img[@src or @data-src or @srcset]")
+STATIC_SLIDE_VIDEOS = etree.XPath(".//iframe/@src")
+STATIC_RANGE_FIRST_PRODUCTS = tuple(etree.XPath(selector) for selector in RANGE_FIRST_PRODUCT_SELECTORS)
+
+# Texts no longer than this are dropped before they leave the browser (menu labels, icons, stray words)
+SECTION_MIN_TEXT_LENGTH = {
+    **dict.fromkeys(SHORT_DESCRIPTION_SELECTORS, 10),
+    **dict.fromkeys(ADVANTAGES_SELECTORS, 20),
+    **dict.fromkeys(LONG_DESCRIPTION_SELECTORS, 50),
+}
+
+# Product pages whose extracted details are kept in memory (oldest entry is evicted first)
+DETAIL_CACHE_SIZE = 256
+
+# Polling interval for explicit waits (seconds); Selenium's default is 0.5
+WAIT_POLL_FREQUENCY = 0.2
+
+# Boilerplate phrases (lowercase) that must never end up in a product description
+ABOUT_WILO_PHRASES = ('über wilo', 'wilo ist ein')
+INTRO_SKIP_PHRASES = ABOUT_WILO_PHRASES + ('anwendung:', 'produkttyp:')
+
+@dataclass
+class CardData:
+    """What the catalog listing tells us about one product card"""
+    __slots__ = ('name', 'card_image_url', 'product_link', 'card_index')
+    name: str
+    card_image_url: str
+    product_link: str
+    card_index: int
+
+def absolute_wilo_url(url):
+    """Make a protocol-relative (//host/...) or site-relative (/path) URL absolute"""
+    if url.startswith('//'):
+        return f"https:{url}"
+    if url.startswith('/'):
+        return f"https://wilo.com{url}"
+    return url
+
+def image_key(url):
+    """Identity of an image URL for de-duplication: host and path, ignoring scheme, query and fragment"""
+    parts = urlsplit(url)
+    return parts.netloc.lower(), parts.path
 
 class WiloCatalogScraper:
     """Enhanced catalog scraper for Wilo products"""
     
     def __init__(self, settings):
         self.settings = settings
-        self.browser_manager = BrowserManager(settings)
+        self.main_browser = BrowserManager.shared(settings)
         self.logger = get_logger(__name__)
         self.is_running = False
         self.progress_callback = None
         self.products_callback = None
         self.catalog_url = "https://wilo.com/de/de/Katalog/de/anwendung/industrie/heizung/heizung"
         
+        # Incremental re-runs: skip product pages that have not changed since the last scrape
+        self.force_rescrape = bool(getattr(settings, 'force_rescrape', False))
+        self.cache = None
+        self.validators_checked = False
+        self.http_session = self._create_http_session()
+        
+        # Step-by-step screenshots are for debugging only; error screenshots are always taken
+        self.debug_screenshots = bool(getattr(settings, 'debug_screenshots', False))
+        
+        # Detail pages can be scraped by a pool of browsers when more than one worker is configured
+        self.browser_workers = max(1, int(getattr(settings, 'browser_workers', 3)))
+        self.browser_pool = None
+        self.thread_state = threading.local()
+        
+        # Product pages are fetched over HTTP in the background while the browser works through the cards
+        self.max_concurrent_requests = max(1, int(getattr(settings, 'max_concurrent_downloads', 3)))
+        self.prefetch_executor = None
+        self.detail_prefetch = {}
+        
+        # Upcoming product pages load in background tabs of the main browser while the current one is extracted
+        self.browser_tabs = max(1, int(getattr(settings, 'browser_tabs', 4)))
+        self.preloaded_tabs = {}
+        
+        # Explicit waits, built once per browser and timeout
+        self.waits = {}
+        self.waits_lock = threading.Lock()
+        
+        # Details already extracted in this session, keyed by product URL, so retries and duplicates are free.
+        # Pool workers write it concurrently, so eviction and insert happen under the lock.
+        self.detail_cache = {}
+        self.detail_cache_lock = threading.Lock()
+        
+    @property
+    def browser_manager(self):
+        """Browser of the current pool worker, or the main browser"""
+        return getattr(self.thread_state, 'browser_manager', None) or self.main_browser
+    
+    def _create_http_session(self):
+        """Create a keep-alive HTTP session shared by all plain (non-browser) requests"""
+        session = requests.Session()
+        session.headers.update({'User-Agent': USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
     def set_progress_callback(self, callback):
         """Set callback for progress updates"""
         self.progress_callback = callback
@@ -38,26 +285,52 @@ class WiloCatalogScraper:
             self.logger.info(f"Starting catalog scraping for max {max_products} products")
             
             if self.progress_callback:
-                self.progress_callback("Initializing browser for catalog scraping...", start_progress=True)
-            
-            if not self.browser_manager.setup_driver():
-                raise Exception("Failed to setup browser")
-                
-            driver = self.browser_manager.get_driver()
-            
-            if self.progress_callback:
-                self.progress_callback("Navigating to Wilo catalog page...")
+                self.progress_callback("Reading Wilo catalog page...", start_progress=True)
             
-            self.logger.info("Navigating to Wilo catalog page...")
-            driver.get(self.catalog_url)
-            time.sleep(5)
+            if not self.force_rescrape:
+                self.cache = ScrapeCache()
+                self.validators_checked = False
             
-            self.browser_manager.take_screenshot("catalog_step1_initial_page.png")
+            # A server-rendered listing needs no catalog browser; the product pages go to the browser pool
+            static_cards = self.fetch_catalog_cards_static(max_products)
             
-            if self.progress_callback:
-                self.progress_callback("Finding product cards...")
+            if static_cards:
+                products = self.iter_products_in_parallel(max_products, static_cards)
+            else:
+                if self.progress_callback:
+                    self.progress_callback("Initializing browser for catalog scraping...")
                 
-            all_products = self.extract_products_from_cards(max_products)
+                if not self.browser_manager.setup_driver():
+                    raise Exception("Failed to setup browser")
+                    
+                driver = self.browser_manager.get_driver()
+                
+                if self.progress_callback:
+                    self.progress_callback("Navigating to Wilo catalog page...")
+                
+                # The listing is only read for names and links; product tabs still load their images
+                self.browser_manager.set_images_blocked(True)
+                
+                self.logger.info("Navigating to Wilo catalog page...")
+                driver.get(self.catalog_url)
+                self.wait_for_page_ready()
+                
+                self.take_debug_screenshot("catalog_step1_initial_page.png")
+                
+                if self.progress_callback:
+                    self.progress_callback("Finding product cards...")
+                    
+                if self.browser_workers > 1 and max_products > 1:
+                    products = self.iter_products_in_parallel(max_products)
+                else:
+                    products = self.iter_products_from_cards(max_products)
+            
+            # Products are handed to the listener as soon as each one is finished
+            all_products = []
+            for product in products:
+                all_products.append(product)
+                if self.products_callback:
+                    self.products_callback(product)
             
             if self.progress_callback:
                 self.progress_callback(f"Catalog scraping completed! Found {len(all_products)} products", stop_progress=True)
@@ -67,26 +340,76 @@ class WiloCatalogScraper:
             
         except Exception as e:
             self.logger.error(f"Catalog scraping failed: {e}")
+            self.browser_manager.flush_screenshots()
             if self.progress_callback:
                 self.progress_callback(f"Catalog scraping failed: {e}", stop_progress=True)
             return []
         finally:
-            self.browser_manager.quit()
+            self.close_browser_pool()
+            self.browser_manager.reset()
+            with self.waits_lock:
+                self.waits = {}
+            if self.cache:
+                self.cache.close()
+                self.cache = None
+    
+    def get_wait(self, timeout=15):
+        """Explicit wait for the current browser, reused across calls with the same timeout"""
+        driver = self.browser_manager.get_driver()
+        with self.waits_lock:
+            wait = self.waits.get((driver, timeout))
+            if wait is None:
+                wait = self.waits[(driver, timeout)] = WebDriverWait(
+                    driver, timeout,
+                    poll_frequency=WAIT_POLL_FREQUENCY,
+                    ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+                )
+            return wait
+    
+    def wait_for_page_ready(self, timeout=30):
+        """Wait until the current document has finished loading"""
+        driver = self.browser_manager.get_driver()
+        try:
+            self.get_wait(timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            self.logger.warning(f"Page still loading after {timeout}s: {driver.current_url}")
+    
+    def wait_for_element(self, xpath, timeout=15):
+        """Wait until an element matching the XPath is present; False on timeout"""
+        driver = self.browser_manager.get_driver()
+        try:
+            self.get_wait(timeout).until(
+                EC.presence_of_element_located((By.XPATH, xpath))
+            )
+            return True
+        except TimeoutException:
+            self.logger.warning(f"⏰ Timed out after {timeout}s waiting for {xpath}")
+            return False
+    
+    def take_debug_screenshot(self, filename):
+        """Buffer a step screenshot in memory when debug screenshots are enabled"""
+        if self.debug_screenshots:
+            self.browser_manager.capture_screenshot(filename)
     
-    def extract_products_from_cards(self, max_products):
-        """Extract products from card elements"""
+    def take_error_screenshot(self, context):
+        """Take a timestamped screenshot for forensics on an error path, plus the buffered steps before it"""
+        self.browser_manager.flush_screenshots()
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        self.browser_manager.take_screenshot(f"error_{context}_{timestamp}.png")
+    
+    def iter_products_from_cards(self, max_products):
+        """Extract products from card elements, yielding each one as it is finished"""
         try:
             driver = self.browser_manager.get_driver()
-            wait = WebDriverWait(driver, 15)
             
-            time.sleep(5)
+            self.wait_for_element(CATALOG_CARD_XPATH)
             
-            card_selectors = [
-                "//div[contains(@class, 'card cl-overview h-100 rebrush')]",
-                "//div[contains(@class, 'card') and contains(@class, 'cl-overview')]"
-            ]
+            card_data_list = self.read_all_card_data(max_products)
+            self.prefetch_detail_pages([card_data.product_link for card_data in card_data_list])
             
-            all_products = []
+            extracted = 0
             
             for i in range(max_products):
                 if not self.is_running:
@@ -98,179 +421,525 @@ class WiloCatalogScraper:
                 try:
                     self.logger.info(f"=== PROCESSING CARD {i+1} ===")
                     
-                    # Enhanced card finding with better debugging
-                    cards = []
-                    current_url = driver.current_url
-                    self.logger.info(f"🌐 Current URL: {current_url}")
-                    
-                    # Verify we're on the catalog page
-                    if not ("katalog" in current_url.lower() and "industrie/heizung" in current_url.lower()):
-                        self.logger.warning(f"⚠️  Not on catalog page, navigating...")
-                        driver.get(self.catalog_url)
-                        time.sleep(5)
-                        self.browser_manager.take_screenshot(f"catalog_navigation_fix_card_{i}.png")
-                    
-                    # Try to find cards with enhanced error handling
-                    for selector_idx, selector in enumerate(card_selectors):
-                        try:
-                            self.logger.info(f"🔍 Trying selector {selector_idx + 1}: {selector}")
-                            found_cards = wait.until(EC.presence_of_all_elements_located((By.XPATH, selector)))
-                            if found_cards:
-                                cards = found_cards
-                                self.logger.info(f"✅ Found {len(cards)} cards with selector {selector_idx + 1}")
-                                
-                                # Verify we have enough cards
-                                if len(cards) > i:
-                                    self.logger.info(f"✅ Card {i+1} is available in the list")
-                                    break
-                                else:
-                                    self.logger.warning(f"⚠️  Only {len(cards)} cards found, but need card {i+1}")
-                                    
-                        except TimeoutException:
-                            self.logger.warning(f"⏰ Timeout with selector {selector_idx + 1}")
-                            continue
-                        except Exception as e:
-                            self.logger.error(f"❌ Error with selector {selector_idx + 1}: {e}")
-                            continue
-                    
-                    # Final validation
-                    if not cards:
-                        self.logger.error(f"❌ No cards found with any selector")
-                        self.browser_manager.take_screenshot(f"no_cards_found_card_{i}.png")
-                        break
-                    
-                    if len(cards) <= i:
-                        self.logger.warning(f"❌ No card found at position {i+1} (found {len(cards)} total cards)")
-                        self.browser_manager.take_screenshot(f"insufficient_cards_card_{i}.png")
-                        
-                        # Try scrolling down to load more cards
-                        try:
-                            self.logger.info("📜 Trying to scroll down to load more cards...")
-                            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                            time.sleep(3)
-                            driver.execute_script("window.scrollTo(0, 0);")
-                            time.sleep(2)
-                            
-                            # Try finding cards again after scroll
-                            for selector in card_selectors:
-                                try:
-                                    refreshed_cards = driver.find_elements(By.XPATH, selector)
-                                    if len(refreshed_cards) > i:
-                                        cards = refreshed_cards
-                                        self.logger.info(f"✅ After scrolling, found {len(cards)} cards")
-                                        break
-                                except:
-                                    continue
-                        except Exception as scroll_e:
-                            self.logger.warning(f"Scroll attempt failed: {scroll_e}")
-                        
-                        if len(cards) <= i:
+                    # Cards with a harvested link are opened by URL; only the rest are looked up on the catalog page
+                    card_data = card_data_list[i] if i < len(card_data_list) else None
+                    card = None
+                    if card_data is None or not card_data.product_link:
+                        card = self.find_card_element(i)
+                        if card is None:
                             break
+                        if card_data is None:
+                            card_data = self.extract_card_data_safe(card, i)
                     
-                    card = cards[i]
-                    self.logger.info(f"🎯 Selected card {i+1} for processing")
-                    
-                    # Extract card data
-                    card_data = self.extract_card_data_safe(card, i)
+                    self.preload_product_tabs([upcoming.product_link for upcoming in card_data_list[i:i + self.browser_tabs]])
                     
                     if card_data:
-                        # Click and extract details
-                        product_detail = self.get_product_details_safe(card, card_data, i)
+                        # Skip unchanged pages that were already scraped on a previous run
+                        product_link = card_data.product_link
+                        last_modified = self.get_last_modified(product_link) if self.cache else None
+                        product_detail = self.cache.get(product_link, last_modified) if last_modified else None
                         
                         if product_detail:
-                            all_products.append(product_detail)
-                            
-                            if self.products_callback:
-                                self.products_callback(product_detail)
+                            self.logger.info(f"⏭️  Unchanged since last run, using cached product: {product_link}")
+                            self.close_preloaded_tabs([product_link])
+                        else:
+                            # Click and extract details
+                            product_detail = self.get_product_details_safe(card, card_data, i)
                             
+                            if product_detail and last_modified:
+                                self.cache.put(product_link, last_modified, product_detail)
+                        
+                        if product_detail:
+                            extracted += 1
                             self.logger.info(f"✅ Successfully extracted: {product_detail['name']}")
+                            yield product_detail
                         else:
                             self.logger.warning(f"❌ Failed to get details for card {i+1}")
                     else:
                         self.logger.warning(f"❌ Failed to extract card data for card {i+1}")
                     
-                    # Add extra wait between cards to ensure proper navigation
-                    if i < max_products - 1:  # Don't wait after the last card
-                        self.logger.info(f"⏳ Waiting before processing next card...")
-                        time.sleep(3)
-                    
                 except Exception as e:
                     self.logger.error(f"❌ Error processing card {i+1}: {e}")
+                    self.take_error_screenshot(f"card_{i}")
                     # Try to return to catalog page before continuing
                     try:
                         driver.get(self.catalog_url)
-                        time.sleep(5)
+                        self.wait_for_element(CATALOG_CARD_XPATH)
                         self.logger.info("🔄 Returned to catalog page after error")
                     except Exception as nav_e:
                         self.logger.error(f"❌ Failed to return to catalog after error: {nav_e}")
                     continue
             
             self.logger.info(f"=== EXTRACTION COMPLETE ===")
-            self.logger.info(f"Successfully processed {len(all_products)} out of {max_products} cards")
-            
-            return all_products
+            self.logger.info(f"Successfully processed {extracted} out of {max_products} cards")
             
         except Exception as e:
             self.logger.error(f"Failed to extract products from cards: {e}")
+        finally:
+            self.stop_prefetch()
+            self.close_preloaded_tabs()
+    
+    def find_card_element(self, i):
+        """Find the i-th card element on the catalog page, scrolling to load more; None if it is not there"""
+        driver = self.browser_manager.get_driver()
+        wait = self.get_wait(15)
+        
+        # Enhanced card finding with better debugging
+        cards = []
+        current_url = driver.current_url
+        self.logger.info(f"🌐 Current URL: {current_url}")
+
+        # Verify we're on the catalog page
+        if not ("katalog" in current_url.lower() and "industrie/heizung" in current_url.lower()):
+            self.logger.warning(f"⚠️  Not on catalog page, navigating...")
+            driver.get(self.catalog_url)
+            self.wait_for_element(CATALOG_CARD_XPATH)
+            self.take_debug_screenshot(f"catalog_navigation_fix_card_{i}.png")
+
+        # Try to find cards with enhanced error handling
+        for selector_idx, selector in enumerate(CARD_SELECTORS):
+            try:
+                self.logger.info(f"🔍 Trying selector {selector_idx + 1}: {selector}")
+                found_cards = wait.until(EC.presence_of_all_elements_located((By.XPATH, selector)))
+                if found_cards:
+                    cards = found_cards
+                    self.logger.info(f"✅ Found {len(cards)} cards with selector {selector_idx + 1}")
+
+                    # Verify we have enough cards
+                    if len(cards) > i:
+                        self.logger.info(f"✅ Card {i+1} is available in the list")
+                        break
+                    else:
+                        self.logger.warning(f"⚠️  Only {len(cards)} cards found, but need card {i+1}")
+
+            except TimeoutException:
+                self.logger.warning(f"⏰ Timeout with selector {selector_idx + 1}")
+                continue
+            except Exception as e:
+                self.logger.error(f"❌ Error with selector {selector_idx + 1}: {e}")
+                continue
+
+        # Final validation
+        if not cards:
+            self.logger.error(f"❌ No cards found with any selector")
+            self.take_error_screenshot(f"no_cards_found_card_{i}")
+            return None
+
+        if len(cards) <= i:
+            self.logger.warning(f"❌ No card found at position {i+1} (found {len(cards)} total cards)")
+            self.take_error_screenshot(f"insufficient_cards_card_{i}")
+
+            # Try scrolling down to load more cards
+            try:
+                self.logger.info("📜 Trying to scroll down to load more cards...")
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                try:
+                    self.get_wait(3).until(
+                        lambda d: len(d.find_elements(By.XPATH, CATALOG_CARD_XPATH)) > i
+                    )
+                except TimeoutException:
+                    self.logger.debug("No more cards appeared after scrolling")
+                driver.execute_script("window.scrollTo(0, 0);")
+
+                # Try finding cards again after scroll
+                for selector in CARD_SELECTORS:
+                    try:
+                        refreshed_cards = driver.find_elements(By.XPATH, selector)
+                        if len(refreshed_cards) > i:
+                            cards = refreshed_cards
+                            self.logger.info(f"✅ After scrolling, found {len(cards)} cards")
+                            break
+                    except (NoSuchElementException, TimeoutException) as e:
+                        self.logger.debug(f"Selector {selector} failed after scrolling: {e}")
+                        continue
+            except Exception as scroll_e:
+                self.logger.warning(f"Scroll attempt failed: {scroll_e}")
+
+            if len(cards) <= i:
+                return None
+
+        card = cards[i]
+        self.logger.info(f"🎯 Selected card {i+1} for processing")
+        return card
+    
+    def iter_products_in_parallel(self, max_products, card_data_list=None):
+        """Collect card links from the catalog page (unless given), then scrape the detail pages with a pool of browsers"""
+        try:
+            if card_data_list is None:
+                driver = self.browser_manager.get_driver()
+                wait = self.get_wait(15)
+
+                try:
+                    wait.until(EC.presence_of_element_located((By.XPATH, CATALOG_CARD_XPATH)))
+                except TimeoutException:
+                    self.logger.error("❌ No cards found on catalog page")
+                    self.take_error_screenshot("no_cards_found")
+                    return
+
+                # Card elements go stale once the page changes, so read everything up front
+                card_data_list = self.read_all_card_data(max_products)
+
+            linked_cards = []
+            for i, card_data in enumerate(card_data_list):
+                if card_data.product_link:
+                    linked_cards.append(card_data)
+                else:
+                    self.logger.warning(f"❌ Card {i+1} has no product link, skipping")
+
+            # Page validators for the cache check are independent requests, so they are fetched side by side
+            validators = [None] * len(linked_cards)
+            if self.cache and linked_cards:
+                # The first page decides whether the site sends validators at all, so it is probed on its own
+                validators[0] = self.get_last_modified(linked_cards[0].product_link)
+            if self.cache and len(linked_cards) > 1:
+                with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+                    validators[1:] = executor.map(self.get_last_modified, [card_data.product_link for card_data in linked_cards[1:]])
+
+            pending = []
+            extracted = 0
+            for card_data, last_modified in zip(linked_cards, validators):
+                product_link = card_data.product_link
+                cached = self.cache.get(product_link, last_modified) if last_modified else None
+                if cached:
+                    self.logger.info(f"⏭️  Unchanged since last run, using cached product: {product_link}")
+                    extracted += 1
+                    yield cached
+                else:
+                    pending.append((card_data, last_modified))
+
+            if not pending:
+                return
+
+            # Server-rendered product pages are read over plain HTTP in parallel; only the rest need a browser
+            browser_pending = []
+            with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+                futures = {
+                    executor.submit(self.extract_product_over_http, card_data): (card_data, last_modified)
+                    for card_data, last_modified in pending
+                }
+
+                for future in as_completed(futures):
+                    card_data, last_modified = futures[future]
+                    product_detail, page_tree = future.result()
+                    if not product_detail:
+                        browser_pending.append((card_data, last_modified, page_tree))
+                        continue
+
+                    if last_modified:
+                        self.cache.put(card_data.product_link, last_modified, product_detail)
+                    extracted += 1
+                    self.logger.info(f"✅ Successfully extracted: {product_detail['name']}")
+                    yield product_detail
+
+            if not browser_pending or not self.is_running:
+                self.logger.info(f"Successfully processed {extracted} out of {max_products} cards")
+                return
+
+            workers = min(self.browser_workers, len(browser_pending))
+            self.create_browser_pool(workers)
+            self.logger.info(f"🚀 Scraping {len(browser_pending)} product pages with {self.browser_pool.qsize()} browsers")
+
+            with ThreadPoolExecutor(max_workers=self.browser_pool.qsize()) as executor:
+                futures = {
+                    executor.submit(self.extract_product_with_pooled_browser, card_data, page_tree): (card_data, last_modified)
+                    for card_data, last_modified, page_tree in browser_pending
+                }
+
+                for done, future in enumerate(as_completed(futures), 1):
+                    card_data, last_modified = futures[future]
+                    if self.progress_callback:
+                        self.progress_callback(f"Processed product page {done}/{len(browser_pending)}")
+
+                    product_detail = future.result()
+                    if not product_detail:
+                        self.logger.warning(f"❌ Failed to get details for card {card_data.card_index+1}")
+                        continue
+
+                    if last_modified:
+                        self.cache.put(card_data.product_link, last_modified, product_detail)
+                    extracted += 1
+                    self.logger.info(f"✅ Successfully extracted: {product_detail['name']}")
+                    yield product_detail
+
+            self.logger.info(f"Successfully processed {extracted} out of {max_products} cards")
+
+        except Exception as e:
+            self.logger.error(f"Failed to extract products in parallel: {e}")
+
+    def create_browser_pool(self, size):
+        """Fill the pool with `size` browsers for detail page workers, starting with the main browser if it is open"""
+        self.browser_pool = queue.Queue()
+
+        # All card links are collected by now, so the main browser is free to work through product pages too.
+        # It is shared across runs, so a leftover handle whose Chrome has gone away must not join the pool.
+        if self.main_browser.is_alive():
+            self.browser_pool.put(self.main_browser)
+            size -= 1
+        if size <= 0:
+            return
+
+        # Pool browsers only read product pages, so they never need to download images or fonts
+        browsers = [BrowserManager(self.settings, profile_name=f"worker_{n}", text_only=True) for n in range(size)]
+
+        # Chrome start-up is mostly waiting, so launch the pool browsers side by side
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            started = list(executor.map(lambda browser: browser.setup_driver(), browsers))
+
+        for browser, ok in zip(browsers, started):
+            if ok:
+                self.browser_pool.put(browser)
+            else:
+                self.logger.warning("Could not start a pool browser")
+                browser.quit()
+
+        if self.browser_pool.empty():
+            raise Exception("Failed to setup any pool browser")
+
+    def close_browser_pool(self):
+        """Quit every browser in the pool"""
+        if not self.browser_pool:
+            return
+        while not self.browser_pool.empty():
+            browser = self.browser_pool.get_nowait()
+            # The main browser only lends itself to the pool; it stays open for the next scrape
+            if browser is not self.main_browser:
+                browser.quit()
+        self.browser_pool = None
+
+    def extract_product_over_http(self, card_data):
+        """Worker: fetch a product page over HTTP; returns (product or None, parsed HTML or None)"""
+        if not self.is_running:
+            return None, None
+
+        page_tree = self.fetch_static_detail(card_data.product_link)
+        if page_tree is None:
+            return None, None
+
+        try:
+            return self.extract_product_details_static(card_data, page_tree), page_tree
+        except Exception as e:
+            self.logger.warning(f"Static extraction failed for {card_data.product_link}: {e}")
+            return None, page_tree
+
+    def extract_product_with_pooled_browser(self, card_data, page_tree=None):
+        """Worker: borrow a pool browser, open the product page directly and extract its details"""
+        if not self.is_running:
+            return None
+
+        browser = self.browser_pool.get()
+        self.thread_state.browser_manager = browser
+        try:
+            browser.get_driver().get(card_data.product_link)
+            self.wait_for_element(PRODUCT_HEADING_XPATH)
+            return self.extract_product_page_details(card_data, page_tree)
+
+        except Exception as e:
+            self.logger.error(f"Failed to get product details for {card_data.product_link}: {e}")
+            self.take_error_screenshot(f"product_details_{card_data.card_index}")
+            return None
+        finally:
+            self.thread_state.browser_manager = None
+            self.browser_pool.put(browser)
+
+    def fetch_catalog_cards_static(self, max_products):
+        """Read the catalog cards over HTTP; empty list if the listing needs the browser"""
+        try:
+            response = self.http_session.get(self.catalog_url, timeout=15)
+            if response.status_code != 200:
+                return []
+            
+            tree = lxml_html.fromstring(response.content)
+            cards = STATIC_CATALOG_CARDS(tree)[:max_products]
+            
+            card_data_list = []
+            for index, card in enumerate(cards):
+                headings = STATIC_CARD_HEADINGS(card)
+                images = STATIC_CARD_IMAGE_SRC(card)
+                links = next((found for found in (link_hrefs(card) for link_hrefs in STATIC_CARD_LINK_HREFS) if found), [])
+                
+                name = headings[0].text_content().strip() if headings else ""
+                card_data_list.append(CardData(
+                    name or f"Product {index + 1}",
+                    urljoin(self.catalog_url, images[0]) if images else "",
+                    urljoin(self.catalog_url, links[0]) if links else "",
+                    index
+                ))
+            
+            # Fewer cards than asked for, or cards without links, mean the listing is rendered client-side
+            if len(card_data_list) < max_products or not all(card_data.product_link for card_data in card_data_list):
+                self.logger.info("Catalog listing is not fully server-rendered, using the browser")
+                return []
+            
+            self.logger.info(f"⚡ Read {len(card_data_list)} catalog cards over HTTP")
+            return card_data_list
+            
+        except (requests.RequestException, etree.LxmlError) as e:
+            self.logger.debug(f"Static catalog fetch failed: {e}")
+            return []
+    
+    def read_all_card_data(self, max_products):
+        """Read the data of the first cards on the catalog page in a single browser call"""
+        try:
+            driver = self.browser_manager.get_driver()
+            raw_cards = driver.execute_script(JS_CARD_DATA, max_products) or []
+            
+            card_data_list = [
+                CardData(raw['name'] or f"Product {index + 1}", raw['card_image_url'], raw['product_link'], index)
+                for index, raw in enumerate(raw_cards)
+            ]
+            self.logger.info(f"Extracted card data for {len(card_data_list)} cards")
+            return card_data_list
+            
+        except Exception as e:
+            self.logger.error(f"Failed to read card data: {e}")
             return []
     
     def extract_card_data_safe(self, card, index):
         """Extract basic data from card"""
         try:
-            product_name = f"Product {index + 1}"
+            driver = self.browser_manager.get_driver()
+            raw = driver.execute_script(JS_ONE_CARD_DATA, card) or {}
             
-            image_url = ""
-            try:
-                img_element = card.find_element(By.XPATH, ".//img")
-                img_src = img_element.get_attribute('src')
-                if img_src:
-                    if img_src.startswith('//'):
-                        image_url = f"https:{img_src}"
-                    elif img_src.startswith('/'):
-                        image_url = f"https://wilo.com{img_src}"
-                    else:
-                        image_url = img_src
-            except:
+            product_name = raw.get('name') or f"Product {index + 1}"
+            image_url = raw.get('card_image_url') or ""
+            product_link = raw.get('product_link') or ""
+            if not image_url:
                 self.logger.debug(f"Could not find image in card {index+1}")
+            if not product_link:
+                self.logger.debug(f"No link found in card {index+1}")
             
-            product_link = ""
-            link_selectors = [
-                ".//a[@class='stretched-link']",
-                ".//a[contains(@class, 'stretched')]",
-                ".//a[@href]"
-            ]
-            
-            for selector in link_selectors:
-                try:
-                    link_element = card.find_element(By.XPATH, selector)
-                    href = link_element.get_attribute('href')
-                    if href:
-                        if href.startswith('/'):
-                            product_link = f"https://wilo.com{href}"
-                        else:
-                            product_link = href
-                        break
-                except:
-                    continue
-            
-            card_data = {
-                'name': product_name,
-                'card_image_url': image_url,
-                'product_link': product_link,
-                'card_index': index
-            }
+            card_data = CardData(product_name, image_url, product_link, index)
             
             self.logger.info(f"Extracted card data for position {index+1}")
             return card_data
             
         except Exception as e:
             self.logger.error(f"Failed to extract card data: {e}")
-            return {
-                'name': f"Product {index + 1}",
-                'card_image_url': '',
-                'product_link': '',
-                'card_index': index
-            }
+            return CardData(f"Product {index + 1}", '', '', index)
+    
+    def get_last_modified(self, url):
+        """Return the page validator: ETag or Last-Modified from a HEAD request; None if the page sends neither"""
+        if not url:
+            return None
+        
+        try:
+            response = self.http_session.head(url, timeout=10, allow_redirects=True)
+            if response.status_code != 200:
+                return None
+            validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+            # Pages without validators are not cached: their ASP.NET view state changes on every request,
+            # so a hash of the body would cost a full download and never match. When the first page has
+            # none, the cache is switched off for the run and no further HEAD requests are made
+            if not self.validators_checked:
+                self.validators_checked = True
+                if not validator and self.cache:
+                    self.logger.info("ℹ️  Product pages send no ETag or Last-Modified; the scrape cache is inactive this run and --force has no effect")
+                    self.cache.close()
+                    self.cache = None
+            return validator
+            
+        except requests.RequestException as e:
+            self.logger.debug(f"Validator request failed for {url}: {e}")
+            return None
+    
+    def prefetch_detail_pages(self, urls):
+        """Start fetching product pages over HTTP in parallel, ahead of the browser"""
+        urls = [url for url in dict.fromkeys(urls) if url]
+        if not urls:
+            return
+        
+        self.prefetch_executor = ThreadPoolExecutor(max_workers=self.max_concurrent_requests)
+        self.detail_prefetch = {url: self.prefetch_executor.submit(self.fetch_static_detail, url) for url in urls}
+        self.logger.info(f"⚡ Prefetching {len(urls)} product pages over HTTP")
+    
+    def stop_prefetch(self):
+        """Drop any prefetches that were not used"""
+        if self.prefetch_executor:
+            self.prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self.prefetch_executor = None
+        self.detail_prefetch = {}
+    
+    def probe_detail_is_static(self, url):
+        """Return the parsed HTML of a server-rendered product page, from the prefetch when available"""
+        if not url:
+            return None
+        
+        future = self.detail_prefetch.pop(url, None)
+        if future is not None:
+            return future.result()
+        return self.fetch_static_detail(url)
+    
+    def fetch_static_detail(self, url):
+        """Fetch a product page over HTTP and return its parsed HTML if the content is server-rendered"""
+        try:
+            response = self.http_session.get(url, timeout=15)
+            if response.status_code != 200 or STATIC_CONTENT_MARKER not in response.text:
+                self.logger.debug(f"Product page needs the browser for text extraction: {url}")
+                return None
+            
+            self.logger.info(f"Product page is server-rendered, parsing text from HTML: {url}")
+            return lxml_html.fromstring(response.content)
+            
+        except (requests.RequestException, etree.LxmlError) as e:
+            self.logger.debug(f"Static probe failed for {url}: {e}")
+            return None
+    
+    def fetch_tables_static(self, url, product_name):
+        """Fetch a range product page over HTTP and parse its technical tables, or None if it needs the browser"""
+        if not url:
+            return None
+        
+        try:
+            response = self.http_session.get(url, timeout=15)
+            if response.status_code != 200:
+                return None
+            
+            tree = lxml_html.fromstring(response.content)
+            tables = STATIC_SPEC_TABLES(tree)
+            
+            table_data = []
+            for i, table in enumerate(tables):
+                headers = STATIC_TABLE_HEADERS(table)
+                table_rows = {}
+                for row in STATIC_TABLE_ROWS(table):
+                    cells = STATIC_ROW_CELLS(row)
+                    if len(cells) >= 2:
+                        key = WHITESPACE_RE.sub(' ', cells[0].text_content()).strip()
+                        value = WHITESPACE_RE.sub(' ', cells[1].text_content()).strip()
+                        if key and value:
+                            table_rows[key] = value
+                
+                table_data.append({
+                    'title': headers[0].text_content().strip() if headers else f"Technical Data Table {i+1}",
+                    'data': table_rows,
+                    'product_name': product_name
+                })
+            
+            if not any(table['data'] for table in table_data):
+                self.logger.debug(f"No server-rendered tables, falling back to the browser: {url}")
+                return None
+            
+            self.logger.info(f"📊 Parsed {len(table_data)} tables over HTTP from {url}")
+            return table_data
+            
+        except (requests.RequestException, etree.LxmlError) as e:
+            self.logger.debug(f"Static table fetch failed for {url}: {e}")
+            return None
+    
+    def find_section_texts(self, selectors, page_tree=None):
+        """Map each XPath to the stripped texts of its matches that are long enough, from static HTML or one browser call"""
+        min_lengths = [SECTION_MIN_TEXT_LENGTH.get(selector, 0) for selector in selectors]
+        
+        if page_tree is not None:
+            section_texts = {}
+            for selector, min_length in zip(selectors, min_lengths):
+                find = STATIC_XPATHS.get(selector) or etree.XPath(selector)
+                texts = (WHITESPACE_RE.sub(' ', elem.text_content()).strip() for elem in find(page_tree))
+                section_texts[selector] = [text for text in texts if len(text) > min_length]
+            return section_texts
+        
+        driver = self.browser_manager.get_driver()
+        return dict(zip(selectors, driver.execute_script(JS_VISIBLE_TEXTS, list(selectors), min_lengths)))
     
     def get_product_details_safe(self, card, card_data, index):
         """Click on card and extract product details"""
@@ -281,34 +950,37 @@ class WiloCatalogScraper:
             catalog_url = driver.current_url
             self.logger.info(f"Stored catalog URL: {catalog_url}")
             
-            # Try clicking via link first
-            clicked = False
-            if card_data.get('product_link'):
-                try:
-                    link_element = card.find_element(By.XPATH, ".//a[@class='stretched-link']")
-                    driver.execute_script("arguments[0].click();", link_element)
-                    self.logger.info(f"Clicked via link for card {index+1}")
-                    clicked = True
-                except Exception as e:
-                    self.logger.warning(f"Link click failed: {e}")
+            # Server-rendered pages let the text fields be parsed without WebDriver round-trips
+            page_tree = self.probe_detail_is_static(card_data.product_link)
             
-            # If link click failed, try clicking the card itself
-            if not clicked:
-                try:
-                    driver.execute_script("arguments[0].click();", card)
-                    self.logger.info(f"Clicked directly on card {index+1}")
-                    clicked = True
-                except Exception as e:
-                    self.logger.error(f"Direct card click failed: {e}")
+            # ...and fully server-rendered ones need no browser at all
+            if page_tree is not None:
+                product_details = self.extract_product_details_static(card_data, page_tree)
+                if product_details:
+                    self.close_preloaded_tabs([card_data.product_link])
+                    return product_details
+            
+            # With a link the product opens in its own tab, so the catalog page never has to be reloaded
+            if card_data.product_link:
+                return self.extract_details_in_new_tab(card_data, page_tree, index)
             
-            if not clicked:
-                self.logger.error(f"Could not click card {index+1}")
+            # Only cards without a captured href get here, so clicking the card is the only way in
+            try:
+                driver.execute_script("arguments[0].click();", card)
+                self.logger.info(f"Clicked directly on card {index+1}")
+            except Exception as e:
+                self.logger.error(f"Could not click card {index+1}: {e}")
                 return None
             
-            time.sleep(5)
-            self.browser_manager.take_screenshot(f"catalog_product_{index}_page.png")
+            # The product page is ready once the card is gone and the heading is there
+            try:
+                self.get_wait(15).until(EC.staleness_of(card))
+            except TimeoutException:
+                self.logger.warning(f"Catalog card {index+1} still attached after click")
+            self.wait_for_element(PRODUCT_HEADING_XPATH)
+            self.take_debug_screenshot(f"catalog_product_{index}_page.png")
             
-            product_details = self.extract_product_page_details(card_data)
+            product_details = self.extract_product_page_details(card_data, page_tree)
             
             # Navigate back to catalog page with multiple fallback methods
             self.logger.info(f"🔄 Starting navigation back to catalog page for next product...")
@@ -323,7 +995,6 @@ class WiloCatalogScraper:
                     # Method 1: Direct navigation to original catalog URL (most reliable)
                     self.logger.info("🌐 Using direct navigation to original catalog URL...")
                     driver.get(self.catalog_url)
-                    time.sleep(5)  # Give more time for page to load
                     
                     # Verify we're on the catalog page by checking URL and page elements
                     current_url = driver.current_url
@@ -333,9 +1004,9 @@ class WiloCatalogScraper:
                     if "katalog" in current_url.lower() and "industrie/heizung" in current_url.lower():
                         # Double-check by looking for product cards
                         try:
-                            wait = WebDriverWait(driver, 10)
+                            wait = self.get_wait(10)
                             cards = wait.until(EC.presence_of_all_elements_located(
-                                (By.XPATH, "//div[contains(@class, 'card cl-overview h-100 rebrush')]")
+                                (By.XPATH, CARD_SELECTORS[0])
                             ))
                             if len(cards) > index + 1:  # Make sure we have more cards to process
                                 self.logger.info(f"✅ Successfully returned to catalog page via direct navigation")
@@ -353,21 +1024,22 @@ class WiloCatalogScraper:
                     self.logger.error(f"❌ Direct navigation attempt {attempt + 1} failed: {e}")
                 
                 if not navigation_success and attempt < max_attempts - 1:
-                    self.logger.info("⏳ Waiting before next attempt...")
-                    time.sleep(3)
+                    # A slow catalog may still finish rendering; give it a short window before retrying
+                    self.logger.info("⏳ Waiting for catalog cards before next attempt...")
+                    self.wait_for_element(CATALOG_CARD_XPATH, timeout=3)
             
             if navigation_success:
-                self.browser_manager.take_screenshot(f"catalog_back_navigation_{index}_success.png")
+                self.take_debug_screenshot(f"catalog_back_navigation_{index}_success.png")
                 self.logger.info(f"🎉 Navigation back to catalog completed successfully!")
             else:
                 self.logger.error("❌ All navigation attempts failed!")
-                self.browser_manager.take_screenshot(f"catalog_back_navigation_{index}_failed.png")
+                self.take_error_screenshot(f"catalog_back_navigation_{index}")
                 
                 # As a last resort, try to refresh the page
                 try:
                     self.logger.info("🔄 Last resort: Refreshing catalog page...")
                     driver.refresh()
-                    time.sleep(5)
+                    self.wait_for_element(CATALOG_CARD_XPATH)
                     navigation_success = True
                 except Exception as e:
                     self.logger.error(f"❌ Even refresh failed: {e}")
@@ -376,111 +1048,287 @@ class WiloCatalogScraper:
             
         except Exception as e:
             self.logger.error(f"Failed to get product details: {e}")
+            self.take_error_screenshot(f"product_details_{index}")
             # Try to navigate back even if extraction failed
             try:
                 self.logger.info("🔄 Attempting navigation back after error...")
                 driver.get(self.catalog_url)
-                time.sleep(5)
+                self.wait_for_element(CATALOG_CARD_XPATH)
                 self.logger.info("✅ Navigated back to catalog after error")
             except Exception as nav_e:
                 self.logger.error(f"❌ Failed to navigate back after error: {nav_e}")
             return None
     
-    def extract_product_page_details(self, card_data):
+    def preload_product_tabs(self, urls):
+        """Start loading product pages in background tabs; the browser fetches them side by side"""
+        driver = self.browser_manager.get_driver()
+        
+        for url in urls:
+            if not url or url in self.preloaded_tabs or len(self.preloaded_tabs) >= self.browser_tabs:
+                continue
+            try:
+                known_handles = set(driver.window_handles)
+                driver.execute_script("window.open(arguments[0], '_blank');", url)
+                new_handles = set(driver.window_handles) - known_handles
+                if new_handles:
+                    self.preloaded_tabs[url] = new_handles.pop()
+            except WebDriverException as e:
+                self.logger.debug(f"Could not preload {url} in a tab: {e}")
+                break
+    
+    def close_preloaded_tabs(self, urls=None):
+        """Close background tabs that will not be used (all of them by default)"""
+        handles = [self.preloaded_tabs.pop(url) for url in list(urls or self.preloaded_tabs) if url in self.preloaded_tabs]
+        if not handles:
+            return
+        
+        driver = self.browser_manager.get_driver()
+        try:
+            catalog_window = driver.current_window_handle
+            for handle in handles:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(catalog_window)
+        except WebDriverException as e:
+            self.logger.debug(f"Could not close preloaded tabs: {e}")
+    
+    def extract_details_in_new_tab(self, card_data, page_tree, index):
+        """Open a product page in a new tab (or its preloaded one), extract it and return to the untouched catalog tab"""
+        driver = self.browser_manager.get_driver()
+        catalog_window = driver.current_window_handle
+        
+        try:
+            preloaded_tab = self.preloaded_tabs.pop(card_data.product_link, None)
+            if preloaded_tab:
+                driver.switch_to.window(preloaded_tab)
+                self.logger.info(f"Switched to preloaded tab for card {index+1}")
+            else:
+                driver.switch_to.new_window('tab')
+                driver.get(card_data.product_link)
+                self.logger.info(f"Opened card {index+1} in a new tab")
+            
+            self.wait_for_element(PRODUCT_HEADING_XPATH)
+            self.take_debug_screenshot(f"catalog_product_{index}_page.png")
+            
+            return self.extract_product_page_details(card_data, page_tree)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get product details: {e}")
+            self.take_error_screenshot(f"product_details_{index}")
+            return None
+        finally:
+            try:
+                if driver.current_window_handle != catalog_window:
+                    driver.close()
+                driver.switch_to.window(catalog_window)
+            except WebDriverException as e:
+                self.logger.error(f"❌ Failed to return to catalog tab: {e}")
+    
+    def extract_product_page_details(self, card_data, page_tree=None):
         """Extract detailed info from product page and navigate to Produktauswahl"""
         try:
             driver = self.browser_manager.get_driver()
             
-            # Get real product name from H1 (but exclude it from the final description)
-            real_product_name = ""
-            try:
-                h1_element = driver.find_element(By.XPATH, "//h1[@class='m-0']")
-                real_product_name = h1_element.text.strip()
-                self.logger.info(f"Extracted real name from H1: {real_product_name}")
-            except:
+            product_url = driver.current_url
+            cached = self.detail_cache.get(product_url)
+            if cached:
+                self.logger.info(f"⏭️  Already extracted in this session: {product_url}")
+                return {**cached, 'extracted_at': time.strftime('%Y-%m-%d %H:%M:%S')}
+            
+            # The rendered DOM is transferred once and the text fields are read from it locally
+            if page_tree is None:
                 try:
-                    h1_element = driver.find_element(By.XPATH, "//h1")
-                    real_product_name = h1_element.text.strip()
-                    self.logger.info(f"Extracted name from fallback H1: {real_product_name}")
-                except:
-                    real_product_name = f"Wilo Product {card_data.get('card_index', 0) + 1}"
-                    self.logger.warning(f"Using fallback name: {real_product_name}")
+                    page_tree = lxml_html.fromstring(driver.page_source)
+                except (etree.ParserError, ValueError) as e:
+                    self.logger.debug(f"Rendered page could not be parsed, reading fields from the browser: {e}")
+            
+            # Real product name from the H1 (excluded from the final description)
+            if page_tree is not None:
+                headings = STATIC_PRODUCT_HEADINGS(page_tree)
+                real_product_name = WHITESPACE_RE.sub(' ', headings[0].text_content()).strip() if headings else ""
+            else:
+                headings = driver.find_elements(By.XPATH, PRODUCT_NAME_XPATH)
+                real_product_name = headings[0].text.strip() if headings else ""
+            
+            if real_product_name:
+                self.logger.info(f"Extracted real name from H1: {real_product_name}")
+            else:
+                real_product_name = f"Wilo Product {card_data.card_index + 1}"
+                self.logger.warning(f"Using fallback name: {real_product_name}")
             
             # Extract media and descriptions from main product page first
             media_items = self.extract_all_media()
-            short_description = self.extract_short_description(real_product_name)
-            advantages = self.extract_advantages()
-            long_description = self.extract_long_description(real_product_name)
+            section_texts = self.find_section_texts(DESCRIPTION_SELECTORS, page_tree)
+            short_description = self.extract_short_description(real_product_name, section_texts=section_texts)
+            advantages = self.extract_advantages(section_texts=section_texts)
+            long_description = self.extract_long_description(real_product_name, section_texts=section_texts)
             
             # Now navigate to Produktauswahl and extract table data
             table_data = self.navigate_to_produktauswahl_and_extract_tables()
             
-            # Create comprehensive product object
-            product = {
-                'id': f"catalog_{card_data['card_index']+1}_{int(time.time())}",
-                'name': real_product_name,
-                'category': 'Industrie Heizung',
-                'subcategory': 'Heizungspumpen',
-                'source': 'catalog',
-                'card_image_url': card_data['card_image_url'],
-                'product_images': media_items['images'],
-                'product_videos': media_items['videos'],
-                'all_media': media_items['all_media'],
-                'short_description': short_description,
-                'advantages': advantages,
-                'long_description': long_description,
-                'full_description': self.build_full_description(short_description, advantages, long_description, table_data, real_product_name),
-                'technical_specifications': table_data,
-                'product_url': driver.current_url,
-                'extracted_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'specifications': {
-                    'brand': 'Wilo',
-                    'series': real_product_name,
-                    'application': 'Industrie Heizung',
-                    'type': 'Heizungspumpe'
-                },
-                'price': 'Price on request',
-                'currency': 'EUR',
-                'country': 'Germany',
-                'status': 'Catalog Product - Real Extraction'
-            }
-            
-            # Debug logging
-            self.logger.info(f"🔍 PRODUCT DEBUG for {real_product_name}:")
-            self.logger.info(f"   Real name from H1: {real_product_name}")
-            self.logger.info(f"   Short desc length: {len(short_description)} chars")
-            self.logger.info(f"   Advantages count: {len(advantages)}")
-            self.logger.info(f"   Product images: {len(media_items['images'])}")
-            self.logger.info(f"   Technical tables: {len(table_data)}")
+            product = self.build_product(
+                card_data, real_product_name, media_items, short_description, advantages,
+                long_description, table_data, driver.current_url
+            )
+            
+            # Debug logging, skipped entirely when INFO is off
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"🔍 PRODUCT DEBUG for {real_product_name}:")
+                self.logger.info(f"   Real name from H1: {real_product_name}")
+                self.logger.info(f"   Short desc length: {len(short_description)} chars")
+                self.logger.info(f"   Advantages count: {len(advantages)}")
+                self.logger.info(f"   Product images: {len(media_items['images'])}")
+                self.logger.info(f"   Technical tables: {len(table_data)}")
             
+            self.remember_details(product_url, product)
             return product
             
         except Exception as e:
             self.logger.error(f"Failed to extract product details: {e}")
             return None
+    
+    def extract_product_details_static(self, card_data, page_tree):
+        """Extract a server-rendered product page from its HTML; None if anything needs the browser"""
+        product_url = card_data.product_link
+        cached = self.detail_cache.get(product_url)
+        if cached:
+            self.logger.info(f"⏭️  Already extracted in this session: {product_url}")
+            return {**cached, 'extracted_at': time.strftime('%Y-%m-%d %H:%M:%S')}
+        
+        try:
+            headings = STATIC_PRODUCT_HEADINGS(page_tree)
+            real_product_name = WHITESPACE_RE.sub(' ', headings[0].text_content()).strip() if headings else ""
+            if not real_product_name:
+                return None
+            
+            section_texts = self.find_section_texts(DESCRIPTION_SELECTORS, page_tree)
+            short_description = self.extract_short_description(real_product_name, section_texts=section_texts)
+            advantages = self.extract_advantages(section_texts=section_texts)
+            long_description = self.extract_long_description(real_product_name, section_texts=section_texts)
+            media_items = self.extract_media_static(page_tree, product_url)
+            if not (short_description and advantages and long_description and media_items['all_media']):
+                self.logger.debug(f"Static HTML is incomplete, using the browser: {product_url}")
+                return None
+            
+            range_links = next((found for found in (find(page_tree) for find in STATIC_RANGE_FIRST_PRODUCTS) if found), [])
+            if not range_links:
+                return None
+            range_link = range_links[0]
+            table_data = self.fetch_tables_static(
+                urljoin(product_url, range_link.get('href', '')),
+                WHITESPACE_RE.sub(' ', range_link.text_content()).strip()
+            )
+            if not table_data:
+                return None
+            
+            product = self.build_product(
+                card_data, real_product_name, media_items, short_description, advantages,
+                long_description, table_data, product_url
+            )
+            self.logger.info(f"⚡ Extracted {real_product_name} without the browser")
+            self.remember_details(product_url, product)
+            return product
+            
+        except (etree.LxmlError, ValueError) as e:
+            self.logger.debug(f"Static extraction failed for {product_url}: {e}")
+            return None
+    
+    def extract_media_static(self, page_tree, page_url):
+        """Read carousel images and videos from server-rendered HTML"""
+        media_items = {'images': [], 'videos': [], 'all_media': []}
+        seen_images = set()
+        seen_videos = set()
+        
+        for slide in STATIC_CAROUSEL_ITEMS(page_tree):
+            images = STATIC_SLIDE_IMAGES(slide)
+            if images:
+                img = images[0]
+                src = img.get('src') or img.get('data-src') or ""
+                if not src and img.get('srcset'):
+                    parts = [part.strip() for part in img.get('srcset').split(',') if part.strip()]
+                    src = parts[-1].split(' ')[0] if parts else ""
+                src = urljoin(page_url, src.strip()) if src.strip() else ""
+                key = image_key(src) if src else None
+                if src and key not in seen_images:
+                    seen_images.add(key)
+                    media_items['images'].append(src)
+                    media_items['all_media'].append({
+                        'type': 'image',
+                        'url': src,
+                        'alt': f'Carousel Image {len(media_items["images"])}',
+                        'source': 'carousel'
+                    })
+                continue
+            
+            videos = STATIC_SLIDE_VIDEOS(slide)
+            if videos:
+                src = urljoin(page_url, videos[0].strip())
+                if src not in seen_videos:
+                    seen_videos.add(src)
+                    media_items['videos'].append(src)
+                    media_items['all_media'].append({
+                        'type': 'video',
+                        'url': src,
+                        'title': f'Product Video {len(media_items["videos"])}',
+                        'source': 'carousel'
+                    })
+        
+        return media_items
+    
+    def build_product(self, card_data, real_product_name, media_items, short_description, advantages,
+                      long_description, table_data, product_url):
+        """Assemble the product record handed to the GUI and the uploader"""
+        return {
+            'id': f"catalog_{card_data.card_index+1}_{int(time.time())}",
+            'name': real_product_name,
+            'category': 'Industrie Heizung',
+            'subcategory': 'Heizungspumpen',
+            'source': 'catalog',
+            'card_image_url': card_data.card_image_url,
+            'product_images': media_items['images'],
+            'product_videos': media_items['videos'],
+            'all_media': media_items['all_media'],
+            'short_description': short_description,
+            'advantages': advantages,
+            'long_description': long_description,
+            'full_description': self.build_full_description(short_description, advantages, long_description, table_data, real_product_name),
+            'technical_specifications': table_data,
+            'product_url': product_url,
+            'extracted_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'specifications': {
+                'brand': 'Wilo',
+                'series': real_product_name,
+                'application': 'Industrie Heizung',
+                'type': 'Heizungspumpe'
+            },
+            'price': 'Price on request',
+            'currency': 'EUR',
+            'country': 'Germany',
+            'status': 'Catalog Product - Real Extraction'
+        }
+    
+    def remember_details(self, product_url, product):
+        """Keep extracted details for the rest of the session, evicting the oldest entry when full"""
+        with self.detail_cache_lock:
+            if product_url not in self.detail_cache and len(self.detail_cache) >= DETAIL_CACHE_SIZE:
+                self.detail_cache.pop(next(iter(self.detail_cache)), None)
+            self.detail_cache[product_url] = product
 
     def navigate_to_produktauswahl_and_extract_tables(self):
         """Navigate to Produktauswahl tab and extract table data from the selected product"""
         try:
             driver = self.browser_manager.get_driver()
-            wait = WebDriverWait(driver, 15)
+            wait = self.get_wait(15)
             table_data = []
             
             # Step 1: Click on Produktauswahl tab
             self.logger.info("Looking for Produktauswahl tab...")
             
-            produktauswahl_selectors = [
-                "//li[@class='nav-item']//a[contains(@href, '#range_productlist') and contains(text(), 'Produktauswahl')]",
-                "//a[contains(@href, '#range_productlist')]",
-                "//a[contains(text(), 'Produktauswahl')]"
-            ]
-            
             produktauswahl_clicked = False
-            for selector in produktauswahl_selectors:
+            for selector in PRODUKTAUSWAHL_TAB_SELECTORS:
                 try:
                     tab_element = wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
                     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab_element)
-                    time.sleep(1)
                     driver.execute_script("arguments[0].click();", tab_element)
                     self.logger.info("✅ Successfully clicked Produktauswahl tab")
                     produktauswahl_clicked = True
@@ -493,28 +1341,26 @@ class WiloCatalogScraper:
                 self.logger.warning("❌ Could not click Produktauswahl tab")
                 return []
             
-            time.sleep(3)
-            self.browser_manager.take_screenshot("produktauswahl_table_page.png")
+            self.wait_for_element(RANGE_TABLE_ROW_XPATH, timeout=10)
+            self.take_debug_screenshot("produktauswahl_table_page.png")
             
             # Step 2: Find the table and click on the first item
             self.logger.info("Looking for product table...")
             
-            table_selectors = [
-                "//table//tbody//tr[1]//td[1]//a",
-                "//tbody//tr[1]//td[1]//a",
-                "//tr[1]//td[1]//a"
-            ]
-            
             first_product_clicked = False
             selected_product_name = ""
-            for selector in table_selectors:
+            for selector in RANGE_FIRST_PRODUCT_SELECTORS:
                 try:
                     first_product_link = wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
                     selected_product_name = first_product_link.text.strip()
                     self.logger.info(f"✅ Found first product in table: {selected_product_name}")
                     
+                    # Server-rendered spec pages can be read over HTTP without leaving the product page
+                    static_tables = self.fetch_tables_static(first_product_link.get_attribute('href'), selected_product_name)
+                    if static_tables:
+                        return static_tables
+                    
                     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", first_product_link)
-                    time.sleep(1)
                     driver.execute_script("arguments[0].click();", first_product_link)
                     self.logger.info(f"✅ Successfully clicked on first product: {selected_product_name}")
                     first_product_clicked = True
@@ -527,32 +1373,30 @@ class WiloCatalogScraper:
                 self.logger.warning("❌ Could not click on first product in table")
                 return []
             
-            time.sleep(5)
-            self.browser_manager.take_screenshot("product_detail_tables_page.png")
+            try:
+                wait.until(EC.staleness_of(first_product_link))
+            except TimeoutException:
+                self.logger.warning("Product table link still attached after click")
+            self.wait_for_element(SPEC_TABLE_XPATH)
+            self.take_debug_screenshot("product_detail_tables_page.png")
             
             # Step 3: Extract all table data from the new page
             self.logger.info("🔍 Starting table data extraction from product detail page...")
             
             # Look for tables with technical specifications
-            table_containers = driver.find_elements(By.XPATH, "//div[contains(@class, 'cl-card-table-simple')]//table[@class='cl-table-simple']")
+            table_containers = driver.find_elements(By.XPATH, SPEC_TABLES_XPATH)
             
             self.logger.info(f"📊 Found {len(table_containers)} tables on the page")
             
             if len(table_containers) == 0:
                 self.logger.warning("❌ No tables found with the expected selectors")
                 # Try alternative selectors
-                alternative_selectors = [
-                    "//table",
-                    "//div[contains(@class, 'table')]//table",
-                    "//div[contains(@class, 'row')]//table"
-                ]
-                
-                for alt_selector in alternative_selectors:
+                for alt_selector in FALLBACK_TABLE_SELECTORS:
                     try:
                         alt_tables = driver.find_elements(By.XPATH, alt_selector)
                         if alt_tables:
                             self.logger.info(f"📊 Found {len(alt_tables)} tables with alternative selector: {alt_selector}")
-                            table_containers = alt_tables[:4]  # Limit to first 4 tables
+                            table_containers = alt_tables
                             break
                     except Exception as e:
                         continue
@@ -564,7 +1408,7 @@ class WiloCatalogScraper:
                     self.logger.info(f"🔍 Processing table {i+1}/{len(table_containers)}...")
                     
                     # Extract table header
-                    header_elements = table.find_elements(By.XPATH, ".//thead//th")
+                    header_elements = table.find_elements(By.XPATH, TABLE_HEADER_XPATH)
                     if header_elements:
                         table_title = header_elements[0].text.strip()
                         table_dict['title'] = table_title
@@ -574,23 +1418,26 @@ class WiloCatalogScraper:
                         self.logger.info(f"📋 No header found, using default title: {table_dict['title']}")
                     
                     # Extract table rows
-                    rows = table.find_elements(By.XPATH, ".//tbody//tr")
+                    rows = table.find_elements(By.XPATH, TABLE_ROW_XPATH)
                     table_rows = {}
                     
                     self.logger.info(f"📝 Found {len(rows)} rows in table")
                     
+                    # Per-row messages are only formatted when DEBUG is on
+                    log_rows = self.logger.isEnabledFor(logging.DEBUG)
                     for row_idx, row in enumerate(rows):
                         try:
-                            cells = row.find_elements(By.XPATH, ".//td")
+                            cells = row.find_elements(By.XPATH, ROW_CELL_XPATH)
                             if len(cells) >= 2:
                                 key = cells[0].text.strip()
                                 value = cells[1].text.strip()
                                 if key and value:
                                     table_rows[key] = value
-                                    self.logger.debug(f"   Row {row_idx+1}: '{key}' = '{value}'")
-                                else:
+                                    if log_rows:
+                                        self.logger.debug(f"   Row {row_idx+1}: '{key}' = '{value}'")
+                                elif log_rows:
                                     self.logger.debug(f"   Row {row_idx+1}: Empty key or value")
-                            else:
+                            elif log_rows:
                                 self.logger.debug(f"   Row {row_idx+1}: Less than 2 cells ({len(cells)} cells)")
                         except Exception as e:
                             self.logger.warning(f"   Error processing row {row_idx+1}: {e}")
@@ -603,8 +1450,8 @@ class WiloCatalogScraper:
                     self.logger.info(f"✅ Successfully extracted {len(table_rows)} data rows from table: '{table_dict['title']}'")
                     
                     # Log first few entries for debugging
-                    if table_rows:
-                        first_entries = list(table_rows.items())[:3]
+                    if table_rows and self.logger.isEnabledFor(logging.INFO):
+                        first_entries = list(islice(table_rows.items(), 3))
                         self.logger.info(f"   Sample data: {first_entries}")
                     
                 except Exception as e:
@@ -616,77 +1463,53 @@ class WiloCatalogScraper:
             self.logger.info(f"🎉 TABLE EXTRACTION COMPLETE!")
             self.logger.info(f"   ✅ Successfully extracted {len(table_data)} tables")
             self.logger.info(f"   ✅ Total data points: {total_data_points}")
-            self.logger.info(f"   📊 Tables found: {[table['title'] for table in table_data]}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"   📊 Tables found: {[table['title'] for table in table_data]}")
             
             if len(table_data) == 0:
                 self.logger.warning("❌ WARNING: No table data was extracted!")
                 # Take a screenshot for debugging
-                self.browser_manager.take_screenshot("no_tables_found_debug.png")
+                self.take_error_screenshot("no_tables_found")
             
             return table_data
             
         except Exception as e:
             self.logger.error(f"❌ Failed to navigate to Produktauswahl and extract tables: {e}")
-            self.browser_manager.take_screenshot("table_extraction_error.png")
+            self.take_error_screenshot("table_extraction")
             return []
 
     def extract_all_media(self):
         """Extract images/videos by clicking thumbnails; if none, capture a single product image."""
         try:
             driver = self.browser_manager.get_driver()
-            wait = WebDriverWait(driver, 10)
+            wait = self.get_wait(10)
             media_items = {'images': [], 'videos': [], 'all_media': []}
+            # Membership checks on sets; the lists keep the order for the result
+            seen_images = set()
+            seen_videos = set()
 
             def _norm(url: str) -> str:
                 if not url:
                     return url
-                url = url.strip()
-                if url.startswith('//'):
-                    return f"https:{url}"
-                if url.startswith('/'):
-                    return f"https://wilo.com{url}"
-                return url
+                return absolute_wilo_url(url.strip())
+
+            def _read_media(root):
+                """Return (type, src) of the media in a carousel element: 'image' or 'video'."""
+                found = driver.execute_script(JS_MEDIA_SOURCE, root)
+                if not found:
+                    return None, None
+                media_type, src = found
+                return media_type, _norm(src)
 
             def _get_active_media_src():
                 """Return (type, src) from the active main slide: 'image' or 'video'."""
                 try:
-                    active = driver.find_element(
-                        By.XPATH,
-                        "//div[contains(@class,'carousel-inner')]"
-                        "//div[contains(@class,'carousel-item') and contains(@class,'active')]"
-                    )
+                    return _read_media(ACTIVE_SLIDE_CSS)
                 except Exception:
                     return None, None
 
-                # Prefer image in active slide
-                try:
-                    img = active.find_element(By.XPATH, ".//img[@src or @data-src or @srcset]")
-                    src = img.get_attribute('src') or img.get_attribute('data-src') or ""
-                    if not src:
-                        srcset = img.get_attribute('srcset') or ""
-                        if srcset:
-                            parts = [p.strip() for p in srcset.split(',') if p.strip()]
-                            if parts:
-                                src = parts[-1].split(' ')[0]
-                    return "image", _norm(src)
-                except Exception:
-                    pass
-
-                # Fallback: iframe video in active slide
-                try:
-                    iframe = active.find_element(By.XPATH, ".//iframe[@src]")
-                    vsrc = iframe.get_attribute('src') or ""
-                    return "video", _norm(vsrc)
-                except Exception:
-                    pass
-
-                return None, None
-
             # 1) Find and iterate thumbnails
-            thumbs = driver.find_elements(
-                By.XPATH,
-                "//div[contains(@class,'cl-image-preview')][.//img]"
-            )
+            thumbs = driver.find_elements(By.XPATH, THUMBNAIL_XPATH)
             self.logger.info(f"Found {len(thumbs)} thumbnail tiles")
 
             if thumbs:
@@ -697,7 +1520,10 @@ class WiloCatalogScraper:
                     try:
                         # Scroll into view (center) to avoid intercept issues
                         driver.execute_script("arguments[0].scrollIntoView({block:'center'});", tile)
-                        time.sleep(0.1)
+                        try:
+                            self.get_wait(2).until(EC.element_to_be_clickable(tile))
+                        except TimeoutException:
+                            self.logger.debug(f"Thumbnail {idx} not clickable after scrolling")
 
                         # Click thumbnail (try standard click first, then JS)
                         try:
@@ -713,27 +1539,21 @@ class WiloCatalogScraper:
                             return False
 
                         try:
-                            result = WebDriverWait(driver, 8).until(_changed)
+                            result = self.get_wait(8).until(_changed)
                             new_type, new_src = result
                         except TimeoutException:
                             # If main didn't update, fall back to the thumb's own img URL
                             try:
-                                timg = tile.find_element(By.XPATH, ".//img[@src or @data-src or @srcset]")
-                                t_src = timg.get_attribute('src') or timg.get_attribute('data-src') or ""
-                                if not t_src:
-                                    t_ss = timg.get_attribute('srcset') or ""
-                                    if t_ss:
-                                        parts = [p.strip() for p in t_ss.split(',') if p.strip()]
-                                        if parts:
-                                            t_src = parts[-1].split(' ')[0]
-                                new_type, new_src = "image", _norm(t_src)
+                                t_type, t_src = _read_media(tile)
+                                new_type, new_src = ("image", t_src) if t_type == "image" else (None, None)
                             except Exception:
                                 new_type, new_src = None, None
 
                         # Record media
                         if new_src:
                             if new_type == "video":
-                                if new_src not in media_items['videos']:
+                                if new_src not in seen_videos:
+                                    seen_videos.add(new_src)
                                     media_items['videos'].append(new_src)
                                     media_items['all_media'].append({
                                         'type': 'video',
@@ -744,7 +1564,9 @@ class WiloCatalogScraper:
                                     self.logger.info(f"[thumb {idx}] Added video: {new_src}")
                             else:
                                 # Accept images including png/jpg/webp/gif; allow others too if provided
-                                if new_src not in media_items['images']:
+                                key = image_key(new_src)
+                                if key not in seen_images:
+                                    seen_images.add(key)
                                     media_items['images'].append(new_src)
                                     media_items['all_media'].append({
                                         'type': 'image',
@@ -787,19 +1609,8 @@ class WiloCatalogScraper:
                     else:
                         # As a last resort, any large image inside the carousel area
                         try:
-                            any_img = driver.find_element(
-                                By.XPATH,
-                                "//div[contains(@class,'carousel-inner')]//img[@src or @data-src or @srcset]"
-                            )
-                            src = any_img.get_attribute('src') or any_img.get_attribute('data-src') or ""
-                            if not src:
-                                ss = any_img.get_attribute('srcset') or ""
-                                if ss:
-                                    parts = [p.strip() for p in ss.split(',') if p.strip()]
-                                    if parts:
-                                        src = parts[-1].split(' ')[0]
-                            src = _norm(src)
-                            if src:
+                            any_type, src = _read_media(CAROUSEL_CSS)
+                            if any_type == "image" and src:
                                 media_items['images'].append(src)
                                 media_items['all_media'].append({
                                     'type': 'image',
@@ -822,41 +1633,28 @@ class WiloCatalogScraper:
             self.logger.error(f"Failed to extract media: {e}")
             return {'images': [], 'videos': [], 'all_media': []}
 
-    def extract_short_description(self, product_name=""):
+    def extract_short_description(self, product_name="", page_tree=None, section_texts=None):
         """Extract short description (excluding product heading)"""
         try:
-            driver = self.browser_manager.get_driver()
-            
-            short_desc_selectors = [
-                "//div[@class='pl-md-8 col']//h3",
-                "//div[@class='pl-md-8 col']//div//p",
-                "//div[contains(@class, 'pl-md-8')]//h3",
-                "//div[contains(@class, 'pl-md-8')]//p"
-            ]
+            if section_texts is None:
+                section_texts = self.find_section_texts(SHORT_DESCRIPTION_SELECTORS, page_tree)
             
             short_description_parts = []
-            
-            for selector in short_desc_selectors:
-                try:
-                    elements = driver.find_elements(By.XPATH, selector)
-                    for elem in elements:
-                        text = elem.text.strip()
-                        # Skip if this text is the product heading or contains unwanted content
-                        if text and len(text) > 10:
-                            # Skip product name and other unwanted content
-                            skip_text = any([
-                                text == product_name,
-                                'über wilo' in text.lower(),
-                                'wilo ist ein' in text.lower(),
-                                text.lower().startswith(product_name.lower().split()[0]) if product_name else False,
-                                'anwendung:' in text.lower(),
-                                'produkttyp:' in text.lower()
-                            ])
-                            
-                            if not skip_text:
-                                short_description_parts.append(text)
-                except:
-                    continue
+            name_words = product_name.lower().split()
+            name_prefix = name_words[0] if name_words else None
+            
+            for selector in SHORT_DESCRIPTION_SELECTORS:
+                for text in section_texts.get(selector, []):
+                    # Skip product name and other unwanted content (short texts never leave the browser)
+                    text_lower = text.lower()
+                    skip_text = (
+                        text == product_name
+                        or any(phrase in text_lower for phrase in INTRO_SKIP_PHRASES)
+                        or (name_prefix is not None and text_lower.startswith(name_prefix))
+                    )
+                    
+                    if not skip_text:
+                        short_description_parts.append(text)
             
             # Remove duplicates while preserving order
             unique_parts = []
@@ -869,7 +1667,7 @@ class WiloCatalogScraper:
             short_description = " ".join(unique_parts)
             
             # Additional cleanup
-            short_description = re.sub(r'\s+', ' ', short_description)  # Remove extra spaces
+            short_description = WHITESPACE_RE.sub(' ', short_description)  # Remove extra spaces
             short_description = short_description.strip()
             
             self.logger.info(f"Extracted short description: {len(short_description)} characters")
@@ -879,30 +1677,20 @@ class WiloCatalogScraper:
             self.logger.error(f"Failed to extract short description: {e}")
             return ""
     
-    def extract_advantages(self):
+    def extract_advantages(self, page_tree=None, section_texts=None):
         """Extract advantages list"""
         try:
-            driver = self.browser_manager.get_driver()
-            
-            advantages_selectors = [
-                "//div[@class='cl-your-advantages']//ul//li",
-                "//div[contains(@class, 'cl-your-advantages')]//li",
-                "//h3[contains(text(), 'Ihre Vorteile')]//following-sibling::div//li"
-            ]
+            if section_texts is None:
+                section_texts = self.find_section_texts(ADVANTAGES_SELECTORS, page_tree)
             
             advantages = []
             
-            for selector in advantages_selectors:
-                try:
-                    li_elements = driver.find_elements(By.XPATH, selector)
-                    if li_elements:
-                        for li in li_elements:
-                            text = li.text.strip()
-                            if text and len(text) > 20:
-                                advantages.append(text)
-                        break
-                except:
-                    continue
+            # First selector with long enough matches wins
+            for selector in ADVANTAGES_SELECTORS:
+                li_texts = section_texts.get(selector)
+                if li_texts:
+                    advantages.extend(li_texts)
+                    break
             
             self.logger.info(f"Extracted {len(advantages)} advantages")
             return advantages
@@ -911,39 +1699,31 @@ class WiloCatalogScraper:
             self.logger.error(f"Failed to extract advantages: {e}")
             return []
     
-    def extract_long_description(self, product_name=""):
+    def extract_long_description(self, product_name="", page_tree=None, section_texts=None):
         """Extract long description"""
         try:
-            driver = self.browser_manager.get_driver()
-            
-            long_desc_selectors = [
-                "//div[contains(@class, 'text-module')]//div[contains(@class, 'text-wrapper')]//p",
-                "//div[contains(@class, 'page-module')]//div[contains(@class, 'text-wrapper')]"
-            ]
+            if section_texts is None:
+                section_texts = self.find_section_texts(LONG_DESCRIPTION_SELECTORS, page_tree)
             
             long_description_parts = []
+            name_words = product_name.lower().split()
+            name_prefix = name_words[0] if name_words else None
             
-            for selector in long_desc_selectors:
-                try:
-                    elements = driver.find_elements(By.XPATH, selector)
-                    for elem in elements:
-                        text = elem.text.strip()
-                        if text and len(text) > 50:
-                            # Clean up the text
-                            text = re.sub(r'\s+', ' ', text)
-                            
-                            # Skip unwanted content
-                            skip_text = any([
-                                'über wilo' in text.lower(),
-                                'wilo ist ein' in text.lower(),
-                                text == product_name,
-                                text.lower().startswith(product_name.lower().split()[0]) if product_name else False
-                            ])
-                            
-                            if not skip_text and text not in long_description_parts:
-                                long_description_parts.append(text)
-                except:
-                    continue
+            for selector in LONG_DESCRIPTION_SELECTORS:
+                for text in section_texts.get(selector, []):
+                    # Clean up the text
+                    text = WHITESPACE_RE.sub(' ', text)
+                    
+                    # Skip unwanted content
+                    text_lower = text.lower()
+                    skip_text = (
+                        text == product_name
+                        or any(phrase in text_lower for phrase in ABOUT_WILO_PHRASES)
+                        or (name_prefix is not None and text_lower.startswith(name_prefix))
+                    )
+                    
+                    if not skip_text and text not in long_description_parts:
+                        long_description_parts.append(text)
             
             long_description = "\n\n".join(long_description_parts)
             self.logger.info(f"Extracted long description: {len(long_description)} characters")
@@ -956,7 +1736,18 @@ class WiloCatalogScraper:
     def build_full_description(self, short_desc, advantages, long_desc, table_data=None, product_name=""):
         """Build comprehensive description (excluding product heading and 'Über Wilo' section)"""
         try:
-            html_parts = []
+            # Parts are written into one buffer, one per line; scraped text is escaped before it becomes HTML
+            buffer = io.StringIO()
+            
+            def write(part):
+                if buffer.tell():
+                    buffer.write("\n")
+                buffer.write(part)
+            
+            # Phrase tuples are built once per product, not once per sentence
+            name_phrase = product_name.lower() if product_name else 'xxxxx'
+            sentence_skip_phrases = (name_phrase,) + INTRO_SKIP_PHRASES
+            paragraph_skip_phrases = ABOUT_WILO_PHRASES + (name_phrase,)
             
             # Clean and deduplicate short description
             if short_desc:
@@ -969,10 +1760,8 @@ class WiloCatalogScraper:
                     sentence = sentence.strip()
                     if sentence and sentence not in seen_sentences and len(sentence) > 10:
                         # Skip sentences that contain product headings or "Über Wilo"
-                        if not any(skip_phrase in sentence.lower() for skip_phrase in [
-                            product_name.lower() if product_name else 'xxxxx',
-                            'über wilo', 'wilo ist ein', 'anwendung:', 'produkttyp:'
-                        ]):
+                        sentence_lower = sentence.lower()
+                        if not any(skip_phrase in sentence_lower for skip_phrase in sentence_skip_phrases):
                             unique_sentences.append(sentence)
                             seen_sentences.add(sentence)
                 
@@ -980,21 +1769,22 @@ class WiloCatalogScraper:
                 if clean_description and not clean_description.endswith('.'):
                     clean_description += '.'
                     
-                html_parts.append(f"<div class='product-intro'>{clean_description}</div>")
+                write(f"<div class='product-intro'>{html.escape(clean_description, quote=False)}</div>")
             
             # Add advantages section
             if advantages:
-                html_parts.append("<h3>Your Advantages</h3>")
-                html_parts.append("<ul>")
+                write("<h3>Your Advantages</h3>")
+                write("<ul>")
                 for advantage in advantages:
                     # Skip empty or very short advantages
-                    if advantage.strip() and len(advantage.strip()) > 10:
-                        html_parts.append(f"<li>{advantage.strip()}</li>")
-                html_parts.append("</ul>")
+                    advantage = advantage.strip()
+                    if len(advantage) > 10:
+                        write(f"<li>{html.escape(advantage, quote=False)}</li>")
+                write("</ul>")
             
             # Add technical specifications from table data
             if table_data:
-                html_parts.append("<h3>Technical Specifications</h3>")
+                write("<h3>Technical Specifications</h3>")
                 
                 for table in table_data:
                     table_title = table.get('title', '')
@@ -1002,12 +1792,12 @@ class WiloCatalogScraper:
                     
                     # Only include tables with meaningful titles and data
                     if table_title and table_rows and len(table_title) > 1:
-                        html_parts.append(f"<h4>{table_title}</h4>")
-                        html_parts.append("<ul>")
+                        write(f"<h4>{html.escape(table_title, quote=False)}</h4>")
+                        write("<ul>")
                         for key, value in table_rows.items():
                             if key.strip() and value.strip():
-                                html_parts.append(f"<li><strong>{key}:</strong> {value}</li>")
-                        html_parts.append("</ul>")
+                                write(f"<li><strong>{html.escape(key, quote=False)}:</strong> {html.escape(value, quote=False)}</li>")
+                        write("</ul>")
             
             # Add long description (cleaned)
             if long_desc:
@@ -1016,16 +1806,15 @@ class WiloCatalogScraper:
                     paragraph = paragraph.strip()
                     if paragraph:
                         # Skip paragraphs that contain "Über Wilo" content or product headings
-                        skip_paragraph = any(skip_phrase in paragraph.lower() for skip_phrase in [
-                            'über wilo', 'wilo ist ein', product_name.lower() if product_name else 'xxxxx'
-                        ])
+                        paragraph_lower = paragraph.lower()
+                        skip_paragraph = any(skip_phrase in paragraph_lower for skip_phrase in paragraph_skip_phrases)
                         
                         if not skip_paragraph and len(paragraph) > 20:
-                            html_parts.append(f"<p>{paragraph}</p>")
+                            write(f"<p>{html.escape(paragraph, quote=False)}</p>")
             
             # Note: Completely removed the "Über Wilo" section as requested
             
-            return "\n".join(html_parts)
+            return buffer.getvalue()
             
         except Exception as e:
             self.logger.error(f"Failed to build description: {e}")
@@ -1045,7 +1834,7 @@ class WiloCatalogScraper:
             driver = self.browser_manager.get_driver()
             driver.get(self.catalog_url)
             
-            time.sleep(5)
+            self.wait_for_element(CATALOG_CARD_XPATH)
             self.browser_manager.take_screenshot("catalog_navigation_test.png")
             
             if "wilo.com" in driver.current_url and "katalog" in driver.current_url.lower():
@@ -1065,7 +1854,7 @@ class WiloCatalogScraper:
                 self.progress_callback(f"Navigation test failed: {e}", stop_progress=True)
             return False
         finally:
-            self.browser_manager.quit()
+            self.browser_manager.reset()
     
     def stop(self):
         """Stop scraping"""
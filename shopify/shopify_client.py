@@ -2,12 +2,28 @@
 Enhanced Shopify API client with product upload functionality
 """
 
+import io
 import requests
 import json
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
 from utils.logger import get_logger
 
+# Closing sections shared by every product description, joined once at import
+DESCRIPTION_FOOTER_HTML = "\n".join((
+    "<h3>Features</h3>",
+    "<ul>",
+    "<li>High-quality German engineering</li>",
+    "<li>Energy-efficient operation</li>",
+    "<li>Reliable performance</li>",
+    "<li>Professional grade components</li>",
+    "</ul>",
+    "<h3>About Wilo</h3>",
+    "<p>Wilo is a leading global manufacturer of pumps and pump systems for heating, cooling, air conditioning, water supply, and wastewater treatment.</p>",
+))
+
 class ShopifyClient:
     """Enhanced Shopify API client for product management"""
     
@@ -32,6 +48,20 @@ class ShopifyClient:
         self.last_request_time = 0
         self.min_request_interval = 0.5  # 500ms between requests
         
+        # One keep-alive session for every API call, so uploads reuse the TLS connection
+        self.session = self._create_session()
+    
+    def _create_session(self):
+        """Create a keep-alive session that retries dropped connections and gateway errors"""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        # 429 is left out: _make_request honours Retry-After itself
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+        
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Optional[Dict]:
         """Make rate-limited API request"""
         try:
@@ -44,13 +74,13 @@ class ShopifyClient:
             url = f"{self.base_url}/{endpoint}"
             
             if method.upper() == 'GET':
-                response = requests.get(url, headers=self.headers)
+                response = self.session.get(url)
             elif method.upper() == 'POST':
-                response = requests.post(url, headers=self.headers, json=data)
+                response = self.session.post(url, json=data)
             elif method.upper() == 'PUT':
-                response = requests.put(url, headers=self.headers, json=data)
+                response = self.session.put(url, json=data)
             elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=self.headers)
+                response = self.session.delete(url)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -270,42 +300,32 @@ class ShopifyClient:
             description = product.get('description', '')
             specs = product.get('specifications', {})
             
-            html_parts = []
+            # Every part is written on its own line into one buffer
+            buffer = io.StringIO()
             
             # Header
-            html_parts.append(f"<h2>{name}</h2>")
+            buffer.write(f"<h2>{name}</h2>\n")
             
             # Basic description
             if description:
-                html_parts.append(f"<p>{description}</p>")
+                buffer.write(f"<p>{description}</p>\n")
             
             # Category information
-            html_parts.append(f"<p><strong>Application:</strong> {category}</p>")
-            html_parts.append(f"<p><strong>Type:</strong> {subcategory}</p>")
+            buffer.write(f"<p><strong>Application:</strong> {category}</p>\n")
+            buffer.write(f"<p><strong>Type:</strong> {subcategory}</p>\n")
             
             # Specifications
             if specs:
-                html_parts.append("<h3>Specifications</h3>")
-                html_parts.append("<ul>")
+                buffer.write("<h3>Specifications</h3>\n<ul>\n")
                 for key, value in specs.items():
                     if value and str(value).strip():
-                        html_parts.append(f"<li><strong>{key.replace('_', ' ').title()}:</strong> {value}</li>")
-                html_parts.append("</ul>")
-            
-            # Features
-            html_parts.append("<h3>Features</h3>")
-            html_parts.append("<ul>")
-            html_parts.append("<li>High-quality German engineering</li>")
-            html_parts.append("<li>Energy-efficient operation</li>")
-            html_parts.append("<li>Reliable performance</li>")
-            html_parts.append("<li>Professional grade components</li>")
-            html_parts.append("</ul>")
-            
-            # Brand info
-            html_parts.append("<h3>About Wilo</h3>")
-            html_parts.append("<p>Wilo is a leading global manufacturer of pumps and pump systems for heating, cooling, air conditioning, water supply, and wastewater treatment.</p>")
-            
-            return "\n".join(html_parts)
+                        buffer.write(f"<li><strong>{key.replace('_', ' ').title()}:</strong> {value}</li>\n")
+                buffer.write("</ul>\n")
+            
+            # Features and brand info
+            buffer.write(DESCRIPTION_FOOTER_HTML)
+            
+            return buffer.getvalue()
             
         except Exception as e:
             self.logger.error(f"Error building description: {e}")
@@ -8,6 +8,12 @@ from pathlib import Path
 from typing import List, Dict, Any
 from utils.logger import get_logger
 
+# Large write buffer so exports hit the disk in few syscalls
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Columns written by the CSV export
+EXPORT_FIELDS = ('name', 'category', 'price', 'description', 'country')
+
 class FileManager:
     """Handles file operations for scraped data"""
     
@@ -17,7 +23,7 @@ class FileManager:
     def export_to_json(self, data: List[Dict], filepath: str) -> bool:
         """Export data to JSON file"""
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
             self.logger.info(f"Data exported to JSON: {filepath}")
@@ -33,21 +39,12 @@ class FileManager:
             if not data:
                 return False
             
-            fieldnames = ['name', 'category', 'price', 'description', 'country']
+            rows = [[product.get(field, '') for field in EXPORT_FIELDS] for product in data]
             
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for product in data:
-                    row = {
-                        'name': product.get('name', ''),
-                        'category': product.get('category', ''),
-                        'price': product.get('price', ''),
-                        'description': product.get('description', ''),
-                        'country': product.get('country', '')
-                    }
-                    writer.writerow(row)
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(EXPORT_FIELDS)
+                writer.writerows(rows)
             
             self.logger.info(f"Data exported to CSV: {filepath}")
             return True
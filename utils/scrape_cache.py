@@ -0,0 +1,73 @@
+"""
+Persistent cache of already-scraped product pages
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from utils.logger import get_logger
+
+DEFAULT_CACHE_PATH = Path.home() / '.wilo_cache' / 'seen.sqlite'
+
+class ScrapeCache:
+    """Remembers scraped product URLs so unchanged pages can be skipped on re-runs"""
+
+    def __init__(self, cache_path: str = None):
+        self.cache_path = Path(cache_path) if cache_path else DEFAULT_CACHE_PATH
+        self.logger = get_logger(__name__)
+        self.lock = threading.Lock()
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # The scraper runs in a worker thread, so the connection is shared across threads
+        self.conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "url TEXT PRIMARY KEY, last_modified TEXT, product TEXT)"
+        )
+        self.conn.commit()
+
+    def get(self, url: str, last_modified: str) -> Optional[Dict]:
+        """Return the cached product if the page has not changed since it was scraped"""
+        if not url or not last_modified:
+            return None
+
+        try:
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT last_modified, product FROM seen WHERE url = ?", (url,)
+                ).fetchone()
+
+            if row and row[0] == last_modified:
+                return json.loads(row[1])
+            return None
+
+        except Exception as e:
+            self.logger.warning(f"Cache lookup failed for {url}: {e}")
+            return None
+
+    def put(self, url: str, last_modified: str, product: Dict):
+        """Store a freshly scraped product"""
+        if not url or not last_modified:
+            return
+
+        try:
+            payload = json.dumps(product, ensure_ascii=False)
+
+            with self.lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO seen (url, last_modified, product) VALUES (?, ?, ?)",
+                    (url, last_modified, payload)
+                )
+                self.conn.commit()
+
+        except Exception as e:
+            self.logger.warning(f"Cache write failed for {url}: {e}")
+
+    def close(self):
+        """Close the cache database"""
+        try:
+            self.conn.close()
+        except sqlite3.Error:
+            pass
@@ -38,11 +38,18 @@ class ScreenshotManager:
             current_time = time.time()
             cutoff_time = current_time - (days * 24 * 60 * 60)
             
+            # One directory read; a file removed by someone else in the meantime is simply skipped
             removed_count = 0
-            for screenshot in self.screenshots_dir.glob("*.png"):
-                if screenshot.stat().st_mtime < cutoff_time:
-                    screenshot.unlink()
-                    removed_count += 1
+            with os.scandir(self.screenshots_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".png") or not entry.is_file():
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff_time:
+                            os.remove(entry.path)
+                            removed_count += 1
+                    except FileNotFoundError:
+                        pass
             
             if removed_count > 0:
                 self.logger.info(f"Removed {removed_count} old screenshots")